@@ -9,8 +9,8 @@
 =========================================================================================
 📌 Main Features:
     - Maintains compatibility with legacy filename (AVAS40_WavGenerator.py → AVAS40_Sound_Generator.py)
-    - Provides same functionality as main.py
-    - Imports all modules for full feature access
+    - Re-exports main() from main.py (single implementation)
+    - Resolves legacy names from all modules on first access (lazy)
     - Compatibility interface for legacy users
     
 📌 Change Log:
@@ -25,7 +25,7 @@
 📌 Dependencies:
     - Python ver 3.12.3
     - PyQt5
-    - Required external files: flac.exe, libFLAC.dll
+    - Required external file: libFLAC.dll
     - All local modules (utils, config, processing, dialogs, main_window, main)
     
 📌 Module Structure:
@@ -40,23 +40,24 @@
 =========================================================================================
 """
 
-# 기존 파일명 호환성을 위해 main.py의 내용을 그대로 포함
-import sys
-from PyQt5.QtWidgets import QApplication
-from main_window import MainWindow
+# 기존 파일명 호환성 유지: 실제 구현은 main.py
+import importlib
+from main import main
 
-def main():
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec_())
+# 기존 코드와의 호환성을 위한 lazy import (필요시 사용 가능)
+# 나중에 import된 모듈이 우선하도록 기존 star-import의 역순으로 검색
+_LEGACY_MODULES = ("main_window", "dialogs", "processing", "config", "utils")
+
+def __getattr__(name):
+    """Resolve legacy names from the local modules on first access (PEP 562)"""
+    if not name.startswith("_"):
+        for module_name in _LEGACY_MODULES:
+            module = importlib.import_module(module_name)
+            if hasattr(module, name):
+                value = getattr(module, name)
+                globals()[name] = value
+                return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 if __name__ == "__main__":
     main()
-
-# 기존 코드와의 호환성을 위한 import (필요시 사용 가능)
-from utils import *
-from config import *
-from processing import *
-from dialogs import *
-from main_window import *
\ No newline at end of file
@@ -9,14 +9,14 @@
 📌 Main Features:
     - AudioProcessor: Converts WAV to FLAC and generates HEX data
     - HexMerger: Merges multiple HEX data and generates headers
-    - WAV downsampling: 48kHz → 24kHz conversion
+    - WAV downsampling: 48kHz → 24kHz conversion (anti-aliasing polyphase FIR)
     - In-memory FLAC conversion (no file creation)
     
 📌 AudioProcessor Key Methods:
     - wav_to_flac(): Convert WAV to FLAC (in-memory)
-    - create_hex_data(): Convert FLAC data to IntelHex object
+    - create_hex_data(): Convert FLAC data to per-file payload bytes
     - _downsample_and_convert_to_flac(): Downsample 48kHz and convert to FLAC
-    - _convert_file_to_flac(): Directly convert 24kHz WAV to FLAC
+    - _read_pcm_samples(): Memory-mapped PCM read (no readframes copy)
     
 📌 HexMerger Key Methods:
     - merge_hex_data_list(): Merge list of HEX data
@@ -26,178 +26,227 @@
     
 📌 Features:
     - No FLAC file is created on disk (all in-memory)
-    - Uses stdout/stdin for pipeline conversion
+    - In-process libFLAC encoding (no flac.exe process per file)
+    - Identical WAV contents in one batch are encoded once (blake2b content hash, shared across workers)
     - Supports 864KB fixed size padding for engine sound
+    - Merges into a contiguous 0xFF-filled buffer (no per-byte IntelHex writes)
     
 📌 Dependencies:
-    - Standard library: os, subprocess, wave, io
-    - External library: intelhex
-    - Local module: utils (constants, exception classes)
-    - External executable: flac.exe
+    - Standard library: os, mmap, wave, hashlib, struct, threading, concurrent.futures
+    - External library: numpy
+    - Local modules: utils (constants, exception classes), flac_encoder
 =========================================================================================
 """
 
 import os
-import subprocess
+import mmap
 import wave
-import io
-from intelhex import IntelHex
-from utils import AudioConstants, FlacConversionError, AudioFileError, get_exe_directory
+import hashlib
+import struct
+import threading
+from concurrent.futures import Future
+import numpy as np
+from utils import AudioConstants, FlacConversionError, AudioFileError
+from flac_encoder import FlacEncoder
 
 class AudioProcessor:
     """Audio file processing class"""
     
+    # Anti-aliasing FIR taps for 2:1 decimation (built on first use)
+    _decimation_taps = None
+    
     def __init__(self, compression_level=None, block_size=None):
         self.compression_level = compression_level or AudioConstants.DEFAULT_COMPRESSION
         self.block_size = block_size or AudioConstants.DEFAULT_BLOCK_SIZE
+        self.flac_encoder = FlacEncoder(self.compression_level, self.block_size)
+        # FLAC data Futures by PCM content hash (identical WAVs in one batch are encoded once,
+        # even when parallel workers reach them at the same time)
+        self._flac_cache = {}
+        self._flac_cache_lock = threading.Lock()
     
     def wav_to_flac(self, wav_file_path: str) -> bytes:
         """Convert WAV to FLAC and return bytes (no file creation)"""
-        if not os.path.exists(wav_file_path):
-            raise AudioFileError(f"WAV file not found: {wav_file_path}")
-        
         # Normalize path
         wav_file_path = os.path.normpath(wav_file_path)
         
-        # Check sample rate
-        with wave.open(wav_file_path, 'rb') as wav_file:
-            sample_rate = wav_file.getframerate()
-            n_channels = wav_file.getnchannels()
-            sample_width = wav_file.getsampwidth()
-            n_frames = wav_file.getnframes()
-            frames = wav_file.readframes(n_frames)
+        # Open directly (no separate exists() stat per file)
+        try:
+            f = open(wav_file_path, 'rb')
+        except FileNotFoundError:
+            raise AudioFileError(f"WAV file not found: {wav_file_path}")
         
-        flac_exe = os.path.join(get_exe_directory(), "flac.exe")
-        if not os.path.exists(flac_exe):
-            raise FlacConversionError("flac.exe not found in application directory")
+        with f:
+            # Check sample rate
+            with wave.open(f, 'rb') as wav_file:
+                sample_rate = wav_file.getframerate()
+                n_channels = wav_file.getnchannels()
+                sample_width = wav_file.getsampwidth()
+                n_frames = wav_file.getnframes()
+                # Header parsed: file position is now the start of the PCM data
+                data_offset = f.tell()
+            
+            if sample_rate not in (48000, 24000):
+                raise AudioFileError(f"Unsupported sample rate: {sample_rate}Hz")
+            
+            samples = self._read_pcm_samples(f, data_offset, n_frames * n_channels * sample_width,
+                                             sample_width, n_channels)
         
-        if sample_rate == 48000:
-            # Downsample 48kHz to 24kHz and convert to FLAC (in-memory)
-            return self._downsample_and_convert_to_flac(frames, sample_width, n_channels, flac_exe)
-        elif sample_rate == 24000:
-            # Directly convert 24kHz WAV to FLAC
-            return self._convert_file_to_flac(wav_file_path, flac_exe)
-        else:
-            raise AudioFileError(f"Unsupported sample rate: {sample_rate}Hz")
+        # Same PCM content and format as an earlier (or in-flight) file: reuse its FLAC data
+        cache_key = (hashlib.blake2b(samples, digest_size=16).digest(), sample_rate, sample_width, n_channels)
+        with self._flac_cache_lock:
+            flac_future = self._flac_cache.get(cache_key)
+            is_first = flac_future is None
+            if is_first:
+                flac_future = Future()
+                self._flac_cache[cache_key] = flac_future
+        
+        if not is_first:
+            # Wait for the worker encoding the same content (re-raises its error)
+            return flac_future.result()
+        
+        try:
+            if sample_rate == 48000:
+                # Downsample 48kHz to 24kHz and convert to FLAC (in-memory)
+                flac_data = self._downsample_and_convert_to_flac(samples, sample_width)
+            else:
+                # Directly convert 24kHz WAV to FLAC
+                flac_data = self.flac_encoder.encode(samples, 24000, sample_width * 8)
+        except BaseException as e:
+            # Waiting duplicates get the same error; later files may retry
+            with self._flac_cache_lock:
+                del self._flac_cache[cache_key]
+            flac_future.set_exception(e)
+            raise
+        
+        flac_future.set_result(flac_data)
+        return flac_data
+    
+    def _read_pcm_samples(self, f, data_offset: int, data_size: int, sample_width: int, n_channels: int) -> np.ndarray:
+        """Memory-map the PCM data chunk and convert it to samples (no intermediate bytes copy)"""
+        if data_size == 0:
+            return self._pcm_to_samples(b"", sample_width, n_channels)
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            frames = memoryview(mm)[data_offset:data_offset + data_size]
+            try:
+                return self._pcm_to_samples(frames, sample_width, n_channels)
+            finally:
+                frames.release()
     
-    def _downsample_and_convert_to_flac(self, frames: bytes, sample_width: int, n_channels: int, flac_exe: str) -> bytes:
+    def _downsample_and_convert_to_flac(self, samples: np.ndarray, sample_width: int) -> bytes:
         """Downsample 48kHz to 24kHz and convert to FLAC (in-memory, no file creation)"""
         try:
-            # 2:1 downsampling
-            frame_size = sample_width * n_channels
-            num_frames = len(frames) // frame_size
-            
-            downsampled_frames = bytearray()
-            for i in range(0, num_frames, 2):
-                start_pos = i * frame_size
-                end_pos = start_pos + frame_size
-                downsampled_frames.extend(frames[start_pos:end_pos])
-            
-            # Create WAV in memory
-            temp_wav_data = io.BytesIO()
-            with wave.open(temp_wav_data, 'wb') as out_wav:
-                out_wav.setnchannels(n_channels)
-                out_wav.setsampwidth(sample_width)
-                out_wav.setframerate(24000)
-                out_wav.writeframes(downsampled_frames)
-            
-            # FLAC conversion (stdin input, stdout output)
-            flac_command = [
-                f'"{flac_exe}"',
-                "--no-padding",
-                f"-{self.compression_level}",
-                f"--blocksize={self.block_size}",
-                "-",  # stdin input
-                "-c"  # stdout output
-            ]
-            
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            
-            process = subprocess.Popen(
-                " ".join(flac_command), 
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                startupinfo=startupinfo
-            )
-            flac_data, stderr = process.communicate(input=temp_wav_data.getvalue())
-            
-            if process.returncode != 0:
-                raise FlacConversionError(f"FLAC conversion failed: {stderr.decode()}")
+            # 2:1 downsampling with anti-aliasing low-pass (polyphase FIR)
+            downsampled = self._quantize_samples(self._decimate_by_two(samples), sample_width)
             
-            return flac_data
+            return self.flac_encoder.encode(downsampled, 24000, sample_width * 8)
             
+        except FlacConversionError:
+            raise
         except Exception as e:
             raise FlacConversionError(f"Error during downsample and FLAC conversion: {str(e)}")
     
-    def _convert_file_to_flac(self, wav_file_path: str, flac_exe: str) -> bytes:
-        """Directly convert 24kHz WAV to FLAC (stdout, no file creation)"""
-        try:
-            flac_command = [
-                f'"{flac_exe}"',
-                "--no-padding",
-                f"-{self.compression_level}",
-                f"--blocksize={self.block_size}",
-                f'"{wav_file_path}"',
-                "-c"  # stdout output
-            ]
-            
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            
-            result = subprocess.run(
-                " ".join(flac_command), 
-                stdout=subprocess.PIPE, 
-                stderr=subprocess.PIPE, 
-                startupinfo=startupinfo,
-                check=True
-            )
-            
-            return result.stdout
-            
-        except subprocess.CalledProcessError as e:
-            raise FlacConversionError(f"FLAC conversion failed: {e.stderr.decode() if e.stderr else str(e)}")
+    @classmethod
+    def _get_decimation_taps(cls) -> np.ndarray:
+        """Kaiser-windowed sinc low-pass with cutoff at the output Nyquist (12kHz for 48kHz input)"""
+        if cls._decimation_taps is None:
+            num_taps = AudioConstants.DECIMATION_FILTER_TAPS
+            m = np.arange(num_taps) - (num_taps - 1) / 2
+            taps = np.sinc(m / 2) * np.kaiser(num_taps, AudioConstants.DECIMATION_KAISER_BETA)
+            cls._decimation_taps = taps / taps.sum()  # Unity gain at DC
+        return cls._decimation_taps
+    
+    def _decimate_by_two(self, samples: np.ndarray) -> np.ndarray:
+        """Low-pass filter and keep every other frame (only the kept outputs are computed)"""
+        taps = self._get_decimation_taps()
+        delay = (len(taps) - 1) // 2
+        even_taps, odd_taps = taps[0::2], taps[1::2]
+        num_out = (len(samples) + 1) // 2
+        if num_out == 0:
+            return np.empty((0, samples.shape[1]))
+        
+        # Polyphase split: y[k] = sum(h_even * x[2k - 2i]) + sum(h_odd * x[2k - 2i - 1]), centered on x[2k]
+        output = np.empty((num_out, samples.shape[1]))
+        for channel in range(samples.shape[1]):
+            x = samples[:, channel]
+            odd_input = x[1::2] if len(x) > 1 else np.zeros(1)
+            even_part = np.convolve(x[0::2], even_taps)[delay // 2:delay // 2 + num_out]
+            odd_part = np.convolve(odd_input, odd_taps)[delay // 2 - 1:delay // 2 - 1 + num_out]
+            output[:, channel] = even_part + odd_part
+        return output
     
-    def create_hex_data(self, flac_data: bytes, sound_type: str, wav_filename: str = "") -> IntelHex:
-        """Create IntelHex object from FLAC data"""
+    def _pcm_to_samples(self, frames: bytes, sample_width: int, n_channels: int) -> np.ndarray:
+        """Convert little-endian PCM bytes (any buffer) to signed int32 samples of shape (frames, channels)"""
+        frame_size = sample_width * n_channels
+        frames = frames[:len(frames) - len(frames) % frame_size]
+        
+        if sample_width == 1:
+            # 8-bit WAV is unsigned
+            samples = np.frombuffer(frames, dtype=np.uint8).astype(np.int32) - 128
+        elif sample_width == 2:
+            samples = np.frombuffer(frames, dtype='<i2').astype(np.int32)
+        elif sample_width == 3:
+            raw = np.frombuffer(frames, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+            packed = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+            samples = (packed << 8) >> 8  # Sign-extend 24-bit
+        elif sample_width == 4:
+            samples = np.frombuffer(frames, dtype='<i4').astype(np.int32)
+        else:
+            raise AudioFileError(f"Unsupported sample width: {sample_width} bytes")
+        
+        return samples.reshape(-1, n_channels)
+    
+    def _quantize_samples(self, samples: np.ndarray, sample_width: int) -> np.ndarray:
+        """Round and clip filtered samples back to the integer range of the sample width"""
+        limit = 1 << (8 * sample_width - 1)
+        return np.clip(np.rint(samples), -limit, limit - 1).astype(np.int32)
+    
+    def create_hex_data(self, flac_data: bytes, sound_type: str, wav_filename: str = "") -> bytearray:
+        """Create per-file HEX payload from FLAC data (one buffer, FLAC data copied once)"""
         if not flac_data:
             raise AudioFileError("Empty FLAC data provided")
         
-        ih = IntelHex()
         flac_size = len(flac_data)
         
-        # Store FLAC size in 4 bytes
-        ih[AudioConstants.FLAC_SIZE_OFFSET] = flac_size & 0xFF
-        ih[AudioConstants.FLAC_SIZE_OFFSET + 1] = (flac_size >> 8) & 0xFF
-        ih[AudioConstants.FLAC_SIZE_OFFSET + 2] = (flac_size >> 16) & 0xFF
-        ih[AudioConstants.FLAC_SIZE_OFFSET + 3] = (flac_size >> 24) & 0xFF
+        # Allocate the whole payload up front (header fields + FLAC data)
+        if sound_type == "Engine Sound":
+            payload = bytearray(AudioConstants.ENGINE_FLAC_DATA_OFFSET + flac_size)
+        else:
+            payload = bytearray(AudioConstants.EVENT_FLAC_DATA_OFFSET + flac_size)
+        
+        # Store FLAC size in 4 bytes (little-endian)
+        self._put(payload, AudioConstants.FLAC_SIZE_OFFSET, struct.pack('<I', flac_size))
         
         if sound_type == "Engine Sound":
             # Engine sound: include filename
-            self._add_engine_data(ih, flac_data, wav_filename)
+            self._add_engine_data(payload, flac_data, wav_filename)
         else:
             # Event sound: FLAC data only
-            self._add_event_data(ih, flac_data)
+            self._add_event_data(payload, flac_data)
         
-        return ih
+        # Returned as is: the merger copies it into the image, no extra bytes() copy
+        return payload
+    
+    def _put(self, payload: bytearray, offset: int, data: bytes):
+        """Write data into the payload at the given offset"""
+        payload[offset:offset + len(data)] = data
     
-    def _add_engine_data(self, ih: IntelHex, flac_data: bytes, wav_filename: str):
+    def _add_engine_data(self, payload: bytearray, flac_data: bytes, wav_filename: str):
         """Add engine sound data (filename + FLAC data)"""
-        # Store filename in 80-byte buffer
-        filename_bytes = wav_filename.ljust(AudioConstants.FILENAME_BUFFER_SIZE, '\x00').encode('utf-8')
-        
-        for i, byte in enumerate(filename_bytes):
-            ih[AudioConstants.ENGINE_FILENAME_OFFSET + i] = byte
+        # Store filename in 80-byte buffer (encode first, then pad the bytes)
+        filename_bytes = wav_filename.encode('utf-8')
+        if len(filename_bytes) > AudioConstants.FILENAME_BUFFER_SIZE:
+            raise AudioFileError(f"File name is longer than {AudioConstants.FILENAME_BUFFER_SIZE} bytes "
+                                 f"(UTF-8): {wav_filename}")
+        filename_bytes = filename_bytes.ljust(AudioConstants.FILENAME_BUFFER_SIZE, b'\x00')
+        self._put(payload, AudioConstants.ENGINE_FILENAME_OFFSET, filename_bytes)
         
         # Store FLAC data
-        for i, byte in enumerate(flac_data):
-            ih[AudioConstants.ENGINE_FLAC_DATA_OFFSET + i] = byte
+        self._put(payload, AudioConstants.ENGINE_FLAC_DATA_OFFSET, flac_data)
     
-    def _add_event_data(self, ih: IntelHex, flac_data: bytes):
+    def _add_event_data(self, payload: bytearray, flac_data: bytes):
         """Add event sound data (FLAC data only)"""
-        for i, byte in enumerate(flac_data):
-            ih[AudioConstants.EVENT_FLAC_DATA_OFFSET + i] = byte
+        self._put(payload, AudioConstants.EVENT_FLAC_DATA_OFFSET, flac_data)
 
 class HexMerger:
     """HEX data merging class"""
@@ -206,97 +255,83 @@ class HexMerger:
         self.sound_type = sound_type
         self.start_address = int(start_address, 16)
     
-    def merge_hex_data_list(self, hex_data_list: list, sound_positions: list = None) -> IntelHex:
-        """Merge list of HEX data"""
+    def merge_hex_data_list(self, hex_data_list: list, sound_positions=None) -> bytearray:
+        """Merge list of HEX data into a contiguous image starting at start_address
+        (sound_positions: parsed 32-bit addresses, e.g. array('I'), engine sound only)"""
         if not hex_data_list:
             raise AudioFileError("No HEX data to merge")
         
-        ih = IntelHex()
+        if self.sound_type == "Event Sound":
+            header_size = AudioConstants.EVENT_HEADER_SIZE
+        else:  # Engine Sound
+            header_size = 4 + 4 * len(sound_positions or [])
+        
+        # Contiguous image pre-filled with 0xFF (header/alignment/tail padding need no writes)
+        buf = bytearray(b'\xFF' * self._calculate_image_size(hex_data_list, header_size))
         current_address = self.start_address
         
         if self.sound_type == "Event Sound":
-            current_address = self._add_event_header(ih, current_address)
-            current_address = self._merge_event_data(ih, hex_data_list, current_address)
+            current_address = self._add_event_header(buf, current_address)
+            current_address = self._merge_event_data(buf, hex_data_list, current_address)
         else:  # Engine Sound
-            current_address = self._add_engine_header(ih, current_address, sound_positions)
-            current_address = self._merge_engine_data(ih, hex_data_list, current_address)
+            current_address = self._add_engine_header(buf, current_address, sound_positions)
+            current_address = self._merge_engine_data(buf, hex_data_list, current_address)
         
-        return ih
-    
-    def _add_event_header(self, ih: IntelHex, current_address: int) -> int:
-        """Add event sound header"""
-        for _ in range(AudioConstants.EVENT_HEADER_SIZE):
-            ih[current_address] = 0xFF
-            current_address += 1
-        return current_address
+        return buf
     
-    def _add_engine_header(self, ih: IntelHex, current_address: int, sound_positions: list) -> int:
-        """Add engine sound header (Magic Key + Sound Positions)"""
-        # Add Magic Key
-        magic_key = AudioConstants.MAGIC_KEY
-        ih[current_address] = magic_key & 0xFF
-        ih[current_address + 1] = (magic_key >> 8) & 0xFF
-        ih[current_address + 2] = (magic_key >> 16) & 0xFF
-        ih[current_address + 3] = (magic_key >> 24) & 0xFF
-        current_address += 4
-        
-        # Add Sound Positions
-        if sound_positions:
-            for position in sound_positions:
-                pos_value = int(position, 16)
-                ih[current_address] = pos_value & 0xFF
-                ih[current_address + 1] = (pos_value >> 8) & 0xFF
-                ih[current_address + 2] = (pos_value >> 16) & 0xFF
-                ih[current_address + 3] = (pos_value >> 24) & 0xFF
-                current_address += 4
+    def _calculate_image_size(self, payloads: list, header_size: int) -> int:
+        """Calculate merged image size (header + aligned payloads, fixed size for engine sound)"""
+        end_address = self.start_address + header_size
+        for payload in payloads:
+            end_address = self._add_padding(end_address + len(payload))
         
-        return current_address
+        image_size = end_address - self.start_address
+        if self.sound_type == "Engine Sound":
+            image_size = max(image_size, AudioConstants.ENGINE_HEX_FILE_SIZE)
+        return image_size
+    
+    def _write(self, buf: bytearray, address: int, data: bytes):
+        """Copy data into the image at the given absolute address"""
+        offset = address - self.start_address
+        buf[offset:offset + len(data)] = data
+    
+    def _add_event_header(self, buf: bytearray, current_address: int) -> int:
+        """Add event sound header (all 0xFF, already pre-filled)"""
+        return current_address + AudioConstants.EVENT_HEADER_SIZE
     
-    def _merge_event_data(self, ih: IntelHex, hex_data_list: list, current_address: int) -> int:
+    def _add_engine_header(self, buf: bytearray, current_address: int, sound_positions) -> int:
+        """Add engine sound header (Magic Key + Sound Positions, packed in one call)"""
+        positions = sound_positions or ()
+        struct.pack_into(f'<{1 + len(positions)}I', buf, current_address - self.start_address,
+                         AudioConstants.MAGIC_KEY, *positions)
+        return current_address + 4 * (1 + len(positions))
+    
+    def _merge_event_data(self, buf: bytearray, payloads: list, current_address: int) -> int:
         """Merge event data"""
-        for temp_ih in hex_data_list:
+        for payload in payloads:
             # Copy data
-            for address in range(temp_ih.minaddr(), temp_ih.maxaddr() + 1):
-                ih[current_address] = temp_ih[address]
-                current_address += 1
+            self._write(buf, current_address, payload)
             
             # 4-byte alignment padding
-            current_address = self._add_padding(ih, current_address)
+            current_address = self._add_padding(current_address + len(payload))
         
         return current_address
     
-    def _merge_engine_data(self, ih: IntelHex, hex_data_list: list, current_address: int) -> int:
+    def _merge_engine_data(self, buf: bytearray, payloads: list, current_address: int) -> int:
         """Merge engine data"""
-        start_address = self.start_address
-        
-        for temp_ih in hex_data_list:
+        for payload in payloads:
             # Copy data
-            for address in range(temp_ih.minaddr(), temp_ih.maxaddr() + 1):
-                ih[current_address] = temp_ih[address]
-                current_address += 1
+            self._write(buf, current_address, payload)
             
             # 4-byte alignment padding
-            current_address = self._add_padding(ih, current_address)
-        
-        # For engine sound, pad to fixed size (864KB)
-        hex_file_size_bytes = int(864.0 * 1024)  # 864KB
-        target_end_address = start_address + hex_file_size_bytes
+            current_address = self._add_padding(current_address + len(payload))
         
-        while current_address < target_end_address:
-            ih[current_address] = 0xFF
-            current_address += 1
-        
-        return current_address
+        # For engine sound, the image is already padded to fixed size (864KB)
+        return max(current_address, self.start_address + AudioConstants.ENGINE_HEX_FILE_SIZE)
     
-    def _add_padding(self, ih: IntelHex, current_address: int) -> int:
-        """Add padding for 4-byte alignment"""
-        padding = current_address % AudioConstants.WORD_ALIGNMENT
-        if padding != 0:
-            padding_to_add = AudioConstants.WORD_ALIGNMENT - padding
-            for _ in range(padding_to_add):
-                ih[current_address] = 0xFF
-                current_address += 1
-        return current_address
+    def _add_padding(self, current_address: int) -> int:
+        """Advance to the next 4-byte boundary (padding bytes are pre-filled with 0xFF)"""
+        return current_address + ((-current_address) & AudioConstants.WORD_ALIGNMENT_MASK)
     
     def get_hex_file_size(self) -> int:
         """Calculate merged HEX file size"""
@@ -15,12 +15,14 @@
 📌 Settings Fields:
     - use_default_path: Whether to use default output path (True/False)
     - custom_output_path: User-defined output path
+    - max_workers: Number of parallel WAV conversion workers (0 = CPU count)
     - settings_file: Path to settings file (located in executable directory)
     
 📌 Key Methods:
     - load_settings(): Load settings from file
     - save_settings(): Save settings to file
     - get_output_base_path(): Get current base output path
+    - get_max_workers(): Get number of parallel conversion workers
     
 📌 Dependencies:
     - Standard library: os, json
@@ -36,6 +38,7 @@ class Settings:
     def __init__(self):
         self.use_default_path = True
         self.custom_output_path = ""
+        self.max_workers = 0
         self.settings_file = os.path.join(get_exe_directory(), "settings.json")
         self.load_settings()
     
@@ -47,17 +50,28 @@ class Settings:
                     data = json.load(f)
                     self.use_default_path = data.get('use_default_path', True)
                     self.custom_output_path = data.get('custom_output_path', "")
+                    self.max_workers = self._parse_max_workers(data.get('max_workers', 0))
         except Exception as e:
             # If loading fails, use default values
             self.use_default_path = True
             self.custom_output_path = ""
+            self.max_workers = 0
+    
+    @staticmethod
+    def _parse_max_workers(value) -> int:
+        """Parse max_workers on its own (an invalid value must not reset the path settings)"""
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return 0  # Automatic (CPU count)
     
     def save_settings(self):
         """Save settings to file"""
         try:
             data = {
                 'use_default_path': self.use_default_path,
-                'custom_output_path': self.custom_output_path
+                'custom_output_path': self.custom_output_path,
+                'max_workers': self.max_workers
             }
             with open(self.settings_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
@@ -70,6 +84,12 @@ class Settings:
             return get_exe_directory()
         else:
             return self.custom_output_path
+    
+    def get_max_workers(self):
+        """Return the number of parallel conversion workers"""
+        if self.max_workers > 0:
+            return self.max_workers
+        return os.cpu_count() or 1
 
 # 전역 설정 인스턴스
 app_settings = Settings() 
\ No newline at end of file
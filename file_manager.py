@@ -15,12 +15,13 @@
 📌 FileManager Key Methods:
     - ensure_output_folder_exists(): Create output folder and check permissions
     - save_bin_file(): Save BIN file (engine sound)
-    - save_hex_file(): Save HEX file (event sound)
+    - save_hex_file(): Save HEX file (event sound, Intel HEX records written directly)
     - save_header_file(): Save C header file (engine sound)
     
 📌 LogManager Key Methods:
     - add_log_entry(): Add log entry
-    - save_log_to_csv(): Save log as CSV file (YYYYMMDD_HHMMSS_log.csv)
+    - add_log_row(): Add table row entry (cells kept for CSV columns)
+    - save_log_to_csv(): Save log as CSV file (YYYYMMDD_HHMMSS_NNNN_SoundGenerator_log.csv, gzip-compressed when large)
     - clear_log_entries(): Clear log entries
     
 📌 OutputPathManager Key Methods:
@@ -35,19 +36,36 @@
     └── EventSound/     (event sound files)
     
 📌 Dependencies:
-    - Standard library: os, csv, datetime
-    - External library: intelhex
+    - Standard library: os, io, re, gzip, time, itertools, struct
     - Local modules: utils, config
 =========================================================================================
 """
 
 import os
-import csv
-from datetime import datetime
-from intelhex import IntelHex
+import io
+import re
+import gzip
+import time
+import itertools
+import struct
 from utils import FileConstants, FilePermissionError, get_exe_directory
 from config import app_settings
 
+# '|' separator of file info log lines, including the whitespace around it
+_PIPE_RE = re.compile(r"\s*\|\s*")
+
+# Log file sequence number (unique names for several saves within one second)
+_log_sequence = itertools.count(1)
+
+# Output folders already created and permission-checked (shared by all FileManagers)
+_prepared_folders = set()
+
+def _escape_csv_field(value: str) -> str:
+    """Quote a CSV field only when needed (same rules as csv.writer's default dialect)"""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
 class FileManager:
     """File management class"""
     
@@ -66,6 +84,10 @@ class FileManager:
     
     def ensure_output_folder_exists(self) -> str:
         """Check if output folder exists and create if not"""
+        # Prepared before: one existence check instead of makedirs + permission check
+        if self.output_folder in _prepared_folders and os.path.isdir(self.output_folder):
+            return self.output_folder
+        
         try:
             os.makedirs(self.output_folder, exist_ok=True)
             
@@ -73,11 +95,12 @@ class FileManager:
             if not os.access(self.output_folder, os.W_OK):
                 raise FilePermissionError(f"No write permission for directory: {self.output_folder}")
             
+            _prepared_folders.add(self.output_folder)
             return self.output_folder
         except OSError as e:
             raise FilePermissionError(f"Failed to create output directory: {e}")
     
-    def save_bin_file(self, hex_data: IntelHex, filename: str = None) -> str:
+    def save_bin_file(self, image: bytes, filename: str = None) -> str:
         """Save BIN file (for engine sound)"""
         if not filename:
             filename = FileConstants.ENGINE_BIN_FILE
@@ -85,12 +108,13 @@ class FileManager:
         file_path = os.path.join(self.output_folder, filename)
         
         try:
-            hex_data.tofile(file_path, format='bin')
+            with open(file_path, 'wb') as f:
+                f.write(image)
             return os.path.basename(file_path)
         except Exception as e:
             raise FilePermissionError(f"Failed to save BIN file: {e}")
     
-    def save_hex_file(self, hex_data: IntelHex, filename: str = None) -> str:
+    def save_hex_file(self, image: bytes, start_address: int, filename: str = None) -> str:
         """Save HEX file (for event sound)"""
         if not filename:
             filename = FileConstants.EVENT_HEX_FILE
@@ -98,12 +122,48 @@ class FileManager:
         file_path = os.path.join(self.output_folder, filename)
         
         try:
-            hex_data.write_hex_file(file_path, write_start_addr=False)
+            self._write_intel_hex_file(image, start_address, file_path)
             return os.path.basename(file_path)
         except Exception as e:
             raise FilePermissionError(f"Failed to save HEX file: {e}")
     
-    def save_header_file(self, hex_data: IntelHex, filename: str = None) -> str:
+    def _write_intel_hex_file(self, image: bytes, start_address: int, file_path: str):
+        """Write the contiguous image as Intel HEX (16-byte data records, same layout as IntelHex)"""
+        end_address = start_address + len(image)
+        # Extended linear address records only when data lies above 64KB
+        use_extended_address = end_address - 1 > 0xFFFF
+        view = memoryview(image)
+        
+        # Text mode: line endings follow the platform (CRLF on Windows), as IntelHex did
+        with open(file_path, 'w', buffering=FileConstants.HEX_WRITE_BUFFER_SIZE) as f:
+            address = start_address
+            while address < end_address:
+                # Records are formatted and written one 64KB segment at a time (bounded memory)
+                segment = address >> 16
+                segment_end = min(end_address, (segment + 1) << 16)
+                
+                records = []
+                if use_extended_address:
+                    records.append(self._format_hex_record(0, 0x04, struct.pack('>H', segment)))
+                
+                # A data record never crosses a 64KB boundary
+                for record_start in range(address, segment_end, 16):
+                    record_end = min(record_start + 16, segment_end)
+                    records.append(self._format_hex_record(record_start & 0xFFFF, 0x00,
+                                                           view[record_start - start_address:record_end - start_address]))
+                records.append("")
+                f.write("\n".join(records))
+                address = segment_end
+            
+            f.write(":00000001FF\n")  # End of file record
+    
+    def _format_hex_record(self, address: int, record_type: int, data) -> str:
+        """Format one Intel HEX record line (':' + length, address, type, data, checksum)"""
+        record = struct.pack('>BHB', len(data), address, record_type) + bytes(data)
+        checksum = -sum(record) & 0xFF
+        return ":" + record.hex().upper() + f"{checksum:02X}"
+    
+    def save_header_file(self, image: bytes, filename: str = None) -> str:
         """Save C header file (for engine sound)"""
         if not filename:
             filename = FileConstants.ENGINE_HEADER_FILE
@@ -111,47 +171,37 @@ class FileManager:
         file_path = os.path.join(self.output_folder, filename)
         
         try:
-            self._write_header_file(hex_data, file_path)
+            self._write_header_file(image, file_path)
             return os.path.basename(file_path)
         except Exception as e:
             raise FilePermissionError(f"Failed to save header file: {e}")
     
-    def _write_header_file(self, hex_data: IntelHex, file_path: str):
-        """Generate and save C header file content"""
+    def _write_header_file(self, image: bytes, file_path: str):
+        """Generate and save C header file content (formatted in memory, written once)"""
+        # Image is already a contiguous byte array
+        total_size = len(image)
+        
+        # Output 16 bytes per line (bytes.hex() per row instead of per-byte formatting)
+        rows = ["0x" + image[i:i + 16].hex(' ').upper().replace(' ', ', 0x')
+                for i in range(0, total_size, 16)]
+        
+        content = "".join([
+            "// Auto-generated header file for AVAS Engine Sound Data\n",
+            "// Generated by AVAS40 Sound Generator\n",
+            f"// Created: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+            "#ifndef ENGINESOUND_VARIANT_H\n",
+            "#define ENGINESOUND_VARIANT_H\n\n",
+            "#include <stdint.h>\n\n",
+            f"// Total data size: {total_size} bytes\n",
+            f"const uint8_t engine_sound_data[{total_size}] = {{\n",
+            "    " + ", \n    ".join(rows) if rows else "",
+            "\n};\n\n",
+            f"#define ENGINE_SOUND_DATA_SIZE {total_size}\n\n",
+            "#endif // ENGINESOUND_VARIANT_H\n",
+        ])
+        
         with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("// Auto-generated header file for AVAS Engine Sound Data\n")
-            f.write("// Generated by AVAS40 Sound Generator\n")
-            f.write(f"// Created: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            f.write("#ifndef ENGINESOUND_VARIANT_H\n")
-            f.write("#define ENGINESOUND_VARIANT_H\n\n")
-            
-            f.write("#include <stdint.h>\n\n")
-            
-            # Convert HEX data to byte array
-            min_addr = hex_data.minaddr()
-            max_addr = hex_data.maxaddr()
-            total_size = max_addr - min_addr + 1
-            
-            f.write(f"// Total data size: {total_size} bytes\n")
-            f.write(f"const uint8_t engine_sound_data[{total_size}] = {{\n")
-            
-            # Output 16 bytes per line
-            for i, addr in enumerate(range(min_addr, max_addr + 1)):
-                if i % 16 == 0:
-                    f.write("    ")
-                
-                f.write(f"0x{hex_data[addr]:02X}")
-                
-                if addr < max_addr:
-                    f.write(", ")
-                    
-                if (i + 1) % 16 == 0 and addr < max_addr:
-                    f.write("\n")
-            
-            f.write("\n};\n\n")
-            f.write(f"#define ENGINE_SOUND_DATA_SIZE {total_size}\n\n")
-            f.write("#endif // ENGINESOUND_VARIANT_H\n")
+            f.write(content)
     
     def get_output_folder_path(self) -> str:
         """Return output folder path"""
@@ -164,6 +214,7 @@ class LogManager:
         self.sound_type = sound_type
         self.file_manager = FileManager(sound_type)
         self.log_entries = []
+        self._log_folder = None  # Output folder already created for log files
     
     def add_log_entry(self, message: str):
         """Add log entry"""
@@ -172,57 +223,51 @@ class LogManager:
             'sound_type': self.sound_type
         })
     
+    def add_log_row(self, *cells: str):
+        """Add table row entry (displayed joined by ' | ', saved as CSV columns)"""
+        self.log_entries.append({
+            'message': " | ".join(cells),
+            'cells': cells,
+            'sound_type': self.sound_type
+        })
+    
     def save_log_to_csv(self, manual_save: bool = False) -> tuple:
         """Save log as CSV file"""
         try:
             # Check/create output folder
-            output_folder = self.file_manager.ensure_output_folder_exists()
+            output_folder = self._get_log_folder()
+            
+            # Snapshot: entries may still be added while a background save runs
+            entries = list(self.log_entries)
+            # Large logs are gzip-compressed (plain CSV keeps the BOM for Excel)
+            compress = sum(len(entry['message']) for entry in entries) > FileConstants.LOG_GZIP_THRESHOLD
             
-            # Generate log filename (YYYYMMDD_HHMMSS_SoundGenerator_log.csv)
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            log_filename = f"{timestamp}_SoundGenerator_log.csv"
+            # Generate log filename (YYYYMMDD_HHMMSS_NNNN_SoundGenerator_log.csv[.gz])
+            timestamp = time.strftime("%Y%m%d_%H%M%S")
+            log_filename = f"{timestamp}_{next(_log_sequence):04d}_SoundGenerator_log.csv"
+            if compress:
+                log_filename += ".gz"
             log_filepath = os.path.join(output_folder, log_filename)
             
-                        # Save as CSV file with UTF-8 BOM for Korean compatibility
-            with open(log_filepath, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                fieldnames = ['Message', 'Start Address', 'Data Length']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            with open(log_filepath, 'wb', buffering=FileConstants.LOG_WRITE_BUFFER_SIZE) as raw_file:
+                if compress:
+                    stream = gzip.GzipFile(fileobj=raw_file, mode='wb', compresslevel=FileConstants.LOG_GZIP_LEVEL)
+                    encoding = 'utf-8'
+                else:
+                    # UTF-8 BOM for Korean compatibility
+                    stream = raw_file
+                    encoding = 'utf-8-sig'
                 
-                writer.writeheader()
-                for entry in self.log_entries:
-                    try:
-                        # Parse file info from message if it contains '|' separator
-                        file_name = ''
-                        start_address = ''
-                        data_length = ''
-                        
-                        # If message contains file info with '|' separator, parse it
-                        if '|' in entry['message']:
-                            parts = entry['message'].split('|')
-                            if len(parts) >= 3:
-                                # Extract file name, start address, and data length from message
-                                file_name = parts[0].strip()
-                                start_address = parts[1].strip()
-                                data_length = parts[2].strip()
-                                
-                                writer.writerow({               
-                                    'Message': file_name,
-                                    #'File Name': file_name,
-                                    'Start Address': start_address,
-                                    'Data Length': data_length
-                                })
-                        else:                                            
-                            writer.writerow({                       
-                                'Message': entry['message']
-                                #'File Name': '',
-                                #'Start Address': '',
-                                #'Data Length': ''
-                            })
-                    except Exception as e:
-                        # If parsing fails, just write the message as is
-                        writer.writerow({                       
-                            'Message': entry['message']
-                        })
+                csvfile = io.TextIOWrapper(stream, encoding=encoding, newline='')
+                self._write_csv_lines(csvfile, entries)
+                csvfile.flush()
+                csvfile.detach()
+                if compress:
+                    stream.close()  # Writes the gzip trailer, file stays open
+                
+                # Flush and sync once at the end (no per-write flushing)
+                raw_file.flush()
+                os.fsync(raw_file.fileno())
             
             return log_filename, manual_save
             
@@ -231,6 +276,35 @@ class LogManager:
             error_details = traceback.format_exc()
             raise FilePermissionError(f"Failed to save log file: {e}\nDetails: {error_details}")
     
+    def _write_csv_lines(self, csvfile, entries: list):
+        """Write log entries as CSV lines in fixed-size batches through one reused list"""
+        batch = ["Message,Start Address,Data Length"]
+        for entry in entries:
+            message = entry['message']
+            
+            # Table rows carry their cells; otherwise split on '|' separator (one part = plain message)
+            parts = entry.get('cells') or _PIPE_RE.split(message.strip())
+            if len(parts) == 1:
+                batch.append(f"{_escape_csv_field(message)},,")
+            elif len(parts) >= 3:
+                # Extract file name, start address, and data length from message
+                batch.append(",".join(_escape_csv_field(part) for part in parts[:3]))
+            
+            if len(batch) >= FileConstants.LOG_WRITE_BATCH_LINES:
+                batch.append("")
+                csvfile.write("\r\n".join(batch))
+                batch.clear()
+        
+        batch.append("")
+        csvfile.write("\r\n".join(batch))
+    
+    def _get_log_folder(self) -> str:
+        """Return log output folder (created and permission-checked only on first save)"""
+        output_folder = self.file_manager.get_output_folder_path()
+        if self._log_folder != output_folder:
+            self._log_folder = self.file_manager.ensure_output_folder_exists()
+        return self._log_folder
+    
     def clear_log_entries(self):
         """Clear log entries"""
         self.log_entries.clear()
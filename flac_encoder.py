@@ -0,0 +1,200 @@
+"""
+=========================================================================================
+📌 File:         flac_encoder.py
+📌 Description:  In-process FLAC encoder for AVAS40 WavGenerator (libFLAC via ctypes)
+📌 Author:       Geunwoo Lee
+📌 Date:         2025-01-15
+📌 Version:      1.00
+=========================================================================================
+📌 Main Features:
+    - FlacEncoder: Encodes PCM sample arrays to FLAC bytes with libFLAC.dll
+    - libFLAC.dll is loaded once from the application directory and reused
+    - Encoder instances are kept after each file and reused (one per worker thread)
+    - Output is written to an in-memory stream (no flac.exe process, no file creation)
+    - Seekable in-memory stream so STREAMINFO is finalized after encoding
+
+📌 FlacEncoder Key Methods:
+    - encode(): Encode interleaved integer samples to FLAC bytes
+    - close(): Delete the idle libFLAC encoder instances
+
+📌 Encoder Settings:
+    - Compression level / block size: same meaning as flac.exe -N / --blocksize
+    - MD5 signature disabled (not used by the target, saves encode time)
+    - Samples are fed in chunks of FLAC_ENCODE_CHUNK_FRAMES frames
+    - No padding block (same as flac.exe --no-padding)
+    - VORBIS_COMMENT block with the vendor string is written by libFLAC itself (same as flac.exe)
+
+📌 Dependencies:
+    - Standard library: os, io, ctypes, threading
+    - External library: numpy
+    - Local module: utils (constants, exception classes)
+    - External library file: libFLAC.dll
+=========================================================================================
+"""
+
+import os
+import io
+import ctypes
+import threading
+import numpy as np
+from utils import AudioConstants, FileConstants, FlacConversionError, get_exe_directory
+
+# libFLAC callback types
+_WRITE_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_ubyte),
+                                   ctypes.c_size_t, ctypes.c_uint, ctypes.c_uint, ctypes.c_void_p)
+_SEEK_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.c_uint64, ctypes.c_void_p)
+_TELL_CALLBACK = ctypes.CFUNCTYPE(ctypes.c_int, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint64), ctypes.c_void_p)
+_METADATA_CALLBACK = ctypes.CFUNCTYPE(None, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_void_p)
+
+# libFLAC status codes
+_INIT_STATUS_OK = 0
+_WRITE_STATUS_OK = 0
+_WRITE_STATUS_FATAL_ERROR = 1
+_SEEK_STATUS_OK = 0
+_TELL_STATUS_OK = 0
+
+# Loaded libFLAC library (shared by all encoders)
+_libflac = None
+
+def _load_libflac():
+    """Load libFLAC.dll from the application directory (once)"""
+    global _libflac
+    if _libflac is not None:
+        return _libflac
+
+    library_path = os.path.join(get_exe_directory(), FileConstants.FLAC_LIBRARY_FILE)
+    if not os.path.exists(library_path):
+        raise FlacConversionError(f"{FileConstants.FLAC_LIBRARY_FILE} not found in application directory")
+
+    try:
+        lib = ctypes.CDLL(library_path)
+    except OSError as e:
+        raise FlacConversionError(f"Failed to load {FileConstants.FLAC_LIBRARY_FILE}: {e}")
+
+    lib.FLAC__stream_encoder_new.restype = ctypes.c_void_p
+    lib.FLAC__stream_encoder_new.argtypes = []
+    lib.FLAC__stream_encoder_delete.restype = None
+    lib.FLAC__stream_encoder_delete.argtypes = [ctypes.c_void_p]
+
+    for name in ("channels", "bits_per_sample", "sample_rate", "compression_level", "blocksize", "do_md5"):
+        setter = getattr(lib, f"FLAC__stream_encoder_set_{name}")
+        setter.restype = ctypes.c_int
+        setter.argtypes = [ctypes.c_void_p, ctypes.c_uint]
+    lib.FLAC__stream_encoder_set_total_samples_estimate.restype = ctypes.c_int
+    lib.FLAC__stream_encoder_set_total_samples_estimate.argtypes = [ctypes.c_void_p, ctypes.c_uint64]
+
+    lib.FLAC__stream_encoder_init_stream.restype = ctypes.c_int
+    lib.FLAC__stream_encoder_init_stream.argtypes = [ctypes.c_void_p, _WRITE_CALLBACK, _SEEK_CALLBACK,
+                                                     _TELL_CALLBACK, _METADATA_CALLBACK, ctypes.c_void_p]
+    lib.FLAC__stream_encoder_process_interleaved.restype = ctypes.c_int
+    lib.FLAC__stream_encoder_process_interleaved.argtypes = [ctypes.c_void_p, ctypes.POINTER(ctypes.c_int32),
+                                                             ctypes.c_uint]
+    lib.FLAC__stream_encoder_finish.restype = ctypes.c_int
+    lib.FLAC__stream_encoder_finish.argtypes = [ctypes.c_void_p]
+    lib.FLAC__stream_encoder_get_resolved_state_string.restype = ctypes.c_char_p
+    lib.FLAC__stream_encoder_get_resolved_state_string.argtypes = [ctypes.c_void_p]
+
+    _libflac = lib
+    return _libflac
+
+class FlacEncoder:
+    """In-process FLAC encoder (libFLAC)"""
+
+    def __init__(self, compression_level, block_size):
+        self.compression_level = int(compression_level)
+        self.block_size = int(block_size)
+        self._idle_encoders = []  # Finished libFLAC encoders, ready for the next file
+        self._lock = threading.Lock()
+        if not 0 <= self.compression_level <= AudioConstants.MAX_COMPRESSION_LEVEL:
+            raise FlacConversionError(f"Unsupported FLAC compression level: {self.compression_level} "
+                                      f"(0-{AudioConstants.MAX_COMPRESSION_LEVEL})")
+        self._lib = _load_libflac()  # Raises FlacConversionError if libFLAC.dll is missing
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """Delete the idle libFLAC encoder instances"""
+        with self._lock:
+            encoders, self._idle_encoders = self._idle_encoders, []
+        for encoder in encoders:
+            self._lib.FLAC__stream_encoder_delete(encoder)
+
+    def encode(self, samples: np.ndarray, sample_rate: int, bits_per_sample: int) -> bytes:
+        """Encode integer samples of shape (frames, channels) to FLAC bytes"""
+        lib = self._lib
+        num_frames, n_channels = samples.shape
+
+        # Reuse a finished encoder (returned to the uninitialized state) if one is idle
+        with self._lock:
+            encoder = self._idle_encoders.pop() if self._idle_encoders else None
+        if encoder is None:
+            encoder = lib.FLAC__stream_encoder_new()
+            if not encoder:
+                raise FlacConversionError("Failed to create FLAC encoder")
+
+        try:
+            # Compression level first: it resets the block size to the preset value
+            ok = (lib.FLAC__stream_encoder_set_channels(encoder, n_channels)
+                  and lib.FLAC__stream_encoder_set_bits_per_sample(encoder, bits_per_sample)
+                  and lib.FLAC__stream_encoder_set_sample_rate(encoder, sample_rate)
+                  and lib.FLAC__stream_encoder_set_compression_level(encoder, self.compression_level)
+                  and lib.FLAC__stream_encoder_set_blocksize(encoder, self.block_size)
+                  and lib.FLAC__stream_encoder_set_do_md5(encoder, False)
+                  and lib.FLAC__stream_encoder_set_total_samples_estimate(encoder, num_frames))
+            if not ok:
+                raise FlacConversionError("Failed to configure FLAC encoder")
+
+            flac_data = self._encode_stream(lib, encoder, samples)
+        except Exception:
+            # Do not reuse an encoder that failed
+            lib.FLAC__stream_encoder_delete(encoder)
+            raise
+
+        with self._lock:
+            self._idle_encoders.append(encoder)
+        return flac_data
+
+    def _encode_stream(self, lib, encoder, samples: np.ndarray) -> bytes:
+        """Run the configured encoder into a seekable in-memory stream"""
+        stream = io.BytesIO()
+
+        def write_callback(_encoder, buffer, num_bytes, _samples, _current_frame, _client_data):
+            try:
+                stream.write(ctypes.string_at(buffer, num_bytes))
+                return _WRITE_STATUS_OK
+            except Exception:
+                return _WRITE_STATUS_FATAL_ERROR
+
+        def seek_callback(_encoder, offset, _client_data):
+            stream.seek(offset)
+            return _SEEK_STATUS_OK
+
+        def tell_callback(_encoder, offset, _client_data):
+            offset[0] = stream.tell()
+            return _TELL_STATUS_OK
+
+        # Keep callback objects referenced until the encoder is finished
+        callbacks = (_WRITE_CALLBACK(write_callback), _SEEK_CALLBACK(seek_callback),
+                     _TELL_CALLBACK(tell_callback), _METADATA_CALLBACK())
+
+        # No metadata is set: libFLAC writes STREAMINFO and an empty VORBIS_COMMENT (vendor string only)
+        status = lib.FLAC__stream_encoder_init_stream(encoder, *callbacks, None)
+        if status != _INIT_STATUS_OK:
+            raise FlacConversionError(f"FLAC encoder initialization failed (status {status})")
+
+        # Feed the samples in chunks: only one chunk is converted to contiguous int32 at a time
+        chunk_frames = AudioConstants.FLAC_ENCODE_CHUNK_FRAMES
+        for start in range(0, samples.shape[0], chunk_frames):
+            chunk = np.ascontiguousarray(samples[start:start + chunk_frames], dtype=np.int32)
+            buffer = chunk.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+            if not lib.FLAC__stream_encoder_process_interleaved(encoder, buffer, chunk.shape[0]):
+                state = lib.FLAC__stream_encoder_get_resolved_state_string(encoder).decode(errors='replace')
+                lib.FLAC__stream_encoder_finish(encoder)
+                raise FlacConversionError(f"FLAC encoding failed: {state}")
+
+        if not lib.FLAC__stream_encoder_finish(encoder):
+            state = lib.FLAC__stream_encoder_get_resolved_state_string(encoder).decode(errors='replace')
+            raise FlacConversionError(f"FLAC encoding failed: {state}")
+
+        return stream.getvalue()
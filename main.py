@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+=========================================================================================
+📌 File:         main.py
+📌 Description:  Entry point for AVAS40 WAV to Binary Generator
+📌 Author:       Geunwoo Lee
+📌 Date:         2025-01-15
+📌 Version:      1.00
+=========================================================================================
+📌 Main Features:
+    - main(): Creates the QApplication and shows the main window
+    - Reuses an existing QApplication instance if one is already running
+    - PyQt5 and UI modules are loaded only when main() is called
+
+📌 How to Run:
+    - python main.py
+
+📌 Dependencies:
+    - Standard library: sys
+    - PyQt5: QApplication
+    - Local module: main_window
+=========================================================================================
+"""
+
+import sys
+
+def main():
+    # PyQt5와 UI 모듈은 실제 실행 시에만 로드
+    from PyQt5.QtWidgets import QApplication
+    from main_window import MainWindow
+
+    # 재진입 시 기존 QApplication 재사용 (Qt 재초기화 방지)
+    app = QApplication.instance() or QApplication(sys.argv)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec_())
+
+if __name__ == "__main__":
+    main()
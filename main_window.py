@@ -18,16 +18,19 @@
     - start_processing(): Start processing and run thread
     - update_fields(): Update fields by sound type
     - show_sound_info_dialog(): Show engine address dialog
-    - save_log(): Save log as CSV file
+    - handle_conversion_partial(): Ask whether to continue when some WAV files failed
+    - save_log(): Save log as CSV file (in background via QThreadPool)
     - append_log(): Add real-time log message
+    - append_logs(): Add a batch of log messages in one update
     
 📌 UI Structure:
     - Input Settings: Input folder selection (drag & drop supported)
-    - Conversion Settings: Compression level, block size (disabled)
+    - Conversion Settings: Compression level (default 8), block size (disabled)
     - Sound Type: Engine/Event radio buttons
     - Address Settings: Start address (auto change by type)
     - Action buttons: Start Processing, Save Log
-    - Log area: Real-time processing status
+    - Log area: Real-time processing status (QPlainTextEdit, bounded block count, timer-batched updates)
+    - Status bar: Log save result (errors shown in non-modal message boxes)
     
 📌 Features:
     - Engine type: Address "10118000" + disabled
@@ -36,23 +39,21 @@
     - Background processing prevents UI block
     
 📌 Dependencies:
-    - Standard library: os, csv, datetime
+    - Standard library: os
     - PyQt5: QMainWindow, QWidget, QVBoxLayout, etc.
-    - Local modules: config, utils, processing, dialogs, file_manager
+    - Local modules: utils, processing, dialogs, file_manager
 =========================================================================================
 """
 
 import os
-import csv
-from datetime import datetime
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
                             QGroupBox, QLabel, QLineEdit, QPushButton, QComboBox, QRadioButton,
-                            QTextEdit, QFileDialog, QMessageBox, QAction, QDialog)
-from config import app_settings
-from utils import TOOL_VERSION, LOG_WIDTH, AudioConstants, UIConstants
-from processing import ProcessingThread, AddressSettingDialog
+                            QPlainTextEdit, QFileDialog, QMessageBox, QAction, QDialog)
+from PyQt5.QtCore import QThreadPool, QTimer, Qt
+from utils import TOOL_VERSION, AudioConstants, UIConstants
+from processing import ProcessingThread, AddressSettingDialog, LogSaveWorker
 from dialogs import SettingsDialog
-from file_manager import LogManager, OutputPathManager
+from file_manager import LogManager
 
 class MainWindow(QMainWindow):
     """Main window class (refactored)"""
@@ -99,8 +100,17 @@ class MainWindow(QMainWindow):
         layout.addLayout(self._create_button_layout())
         
         # Log text area
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
+        # Keep memory bounded for very long sessions (oldest lines are dropped)
+        self.log_text.setMaximumBlockCount(UIConstants.LOG_MAX_BLOCK_COUNT)
+        
+        # Log lines waiting to be shown (flushed by a single-shot timer)
+        self._pending_log_lines = []
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(UIConstants.LOG_FLUSH_INTERVAL_MS)
+        self._log_flush_timer.timeout.connect(self._flush_log_view)
         layout.addWidget(self.log_text)
     
     def _create_input_group(self) -> QGroupBox:
@@ -130,9 +140,10 @@ class MainWindow(QMainWindow):
         
         # Compression level
         self.compression_combo = QComboBox()
-        self.compression_combo.addItems([str(x) for x in range(11)])
+        self.compression_combo.addItems([str(x) for x in range(AudioConstants.MAX_COMPRESSION_LEVEL + 1)])
         self.compression_combo.setCurrentText(AudioConstants.DEFAULT_COMPRESSION)
-        self.compression_combo.setEnabled(False)  # Disabled
+        # Lower levels encode noticeably faster at a slightly larger output size
+        self.compression_combo.setToolTip("FLAC compression level (0 = fastest, 8 = smallest output)")
         
         # Block size
         self.block_size_combo = QComboBox()
@@ -192,14 +203,14 @@ class MainWindow(QMainWindow):
         """Initialize processing objects"""
         # Processing thread
         self.processing_thread = ProcessingThread()
-        self.processing_thread.log_message.connect(self.append_log)
+        self.processing_thread.log_messages.connect(self.append_logs)
         self.processing_thread.finished.connect(self.enable_buttons)
-        self.processing_thread.save_log.connect(lambda: self.save_log(auto_save=True))
         self.processing_thread.show_info_dialog.connect(self.show_sound_info_dialog)
         self.processing_thread.no_wav_files.connect(self.handle_no_wav_files)
-        
-        # Log manager is initialized at processing start
-        self.log_manager = None
+        self.processing_thread.conversion_failed.connect(self.handle_conversion_failed)
+        self.processing_thread.conversion_partial.connect(self.handle_conversion_partial)
+        # Shadow copy of the log text (saved without reading the widget back)
+        self._log_lines = []
         
     def dragEnterEvent(self, event):
         """Handle drag and drop event"""
@@ -264,15 +275,13 @@ class MainWindow(QMainWindow):
         if not self._validate_input():
             return
         
-        # Initialize log manager
-        sound_type = "Engine Sound" if self.engine_radio.isChecked() else "Event Sound"
-        self.log_manager = LogManager(sound_type)
-        
         # Disable UI
         self.disable_buttons()
         
         # Clear log
+        self._pending_log_lines.clear()
         self.log_text.clear()
+        self._log_lines.clear()
         
         # Set processing parameters
         self._set_processing_parameters()
@@ -327,34 +336,64 @@ class MainWindow(QMainWindow):
         
     def append_log(self, message):
         """Add log message"""
-        self.log_text.append(message)
-        # Also add to log manager
-        if self.log_manager:
-            self.log_manager.add_log_entry(message)
+        self.append_logs([message])
+    
+    def append_logs(self, messages):
+        """Add several log messages (shown together with other lines of the same interval)"""
+        if not messages:
+            return
+        self._log_lines.extend(messages)
+        self._pending_log_lines.extend(messages)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_log_view(self):
+        """Show pending log lines with a single text update"""
+        if not self._pending_log_lines:
+            return
+        messages, self._pending_log_lines = self._pending_log_lines, []
+        # One repaint for the whole batch
+        self.log_text.setUpdatesEnabled(False)
+        try:
+            self.log_text.appendPlainText("\n".join(messages))
+        finally:
+            self.log_text.setUpdatesEnabled(True)
         
-    def save_log(self, auto_save=False):
-        """Save log"""
+    def save_log(self):
+        """Save displayed log (manual save; each processing run saves its own log)"""
         try:
-            if not self.log_manager:
-                sound_type = "Engine Sound" if self.engine_radio.isChecked() else "Event Sound"
-                self.log_manager = LogManager(sound_type)
-                
-                # Add current log text to log manager
-                log_content = self.log_text.toPlainText()
-                for line in log_content.split('\n'):
-                    if line.strip():
-                        self.log_manager.add_log_entry(line.strip())
+            sound_type = "Engine Sound" if self.engine_radio.isChecked() else "Event Sound"
+            log_manager = LogManager(sound_type)
             
-            # Save as CSV file
-            log_filename, is_manual = self.log_manager.save_log_to_csv(manual_save=not auto_save)
+            # Add current log text to log manager (from the shadow list, not the widget)
+            for message in self._log_lines:
+                for line in message.split("\n"):
+                    line = line.strip()
+                    if line:
+                        log_manager.add_log_entry(line)
             
-            if is_manual:  # Show popup only for manual save
-                QMessageBox.information(self, "Save Complete", f"Log saved as: {log_filename}")
-            else:  # For auto-save, only show in log (already handled in append_log)
-                pass
+            # Save as CSV file (on a worker thread, result comes back as a signal)
+            worker = LogSaveWorker(log_manager, manual_save=True)
+            worker.signals.saved.connect(self._on_log_saved)
+            worker.signals.failed.connect(self._on_log_save_failed)
+            QThreadPool.globalInstance().start(worker)
                 
         except Exception as e:
-            QMessageBox.warning(self, "Save Error", f"Failed to save log: {str(e)}")
+            self._show_warning("Save Error", f"Failed to save log: {str(e)}")
+    
+    def _on_log_saved(self, log_filename, is_manual):
+        """Log file saved"""
+        self.statusBar().showMessage(f"Log saved as: {log_filename}", UIConstants.STATUS_MESSAGE_TIMEOUT_MS)
+    
+    def _on_log_save_failed(self, error):
+        """Log file could not be saved"""
+        self._show_warning("Save Error", f"Failed to save log: {error}")
+    
+    def _show_warning(self, title, text):
+        """Show non-modal warning message box (does not block the event loop)"""
+        message_box = QMessageBox(QMessageBox.Warning, title, text, QMessageBox.Ok, self)
+        message_box.setAttribute(Qt.WA_DeleteOnClose)
+        message_box.show()
         
     def show_sound_info_dialog(self, wav_files, start_addresses, sound_positions):
         """Show sound info dialog (engine sound only)"""
@@ -364,45 +403,35 @@ class MainWindow(QMainWindow):
         if result == QDialog.Accepted:
             # When dialog is closed normally
             updated_positions = dialog.get_sound_positions()
-            self._log_engine_sound_positions(wav_files, start_addresses, updated_positions)
             
-            # Continue engine processing in ProcessingThread
+            # Continue engine processing in ProcessingThread (logs the position table)
             self.processing_thread.complete_engine_processing(updated_positions)
         else:
             # If dialog is cancelled, finish thread
             self.processing_thread.finished.emit()
     
-    def _log_engine_sound_positions(self, wav_files, start_addresses, sound_positions):
-        """Output engine sound position info to log"""
-        self.append_log("\n" + "< Engine Sound Position Information >")
-        self.append_log("-" * LOG_WIDTH)
-        self.append_log(f"{'Position'.center(20)}|{'Wave File'.center(60)}")
-        self.append_log("-" * LOG_WIDTH)
-        
-        position_labels = [
-            "Sound F1 ", "Sound F2 ", "Sound F3 ",
-            "Sound S1 ", "Sound S2 ", "Sound S3 ",
-            "Sound C1 ", "Sound C2 ",
-            "Sound R1 ", "Sound R2 "
-        ]
-        
-        for i, (label, position) in enumerate(zip(position_labels, sound_positions)):
-            if position.upper() != "FFFFFFFF":
-                # Find matching WAV file for this address
-                position_addr = int(position, 16)
-                wave_file = "Not found"
-                for j, start_addr in enumerate(start_addresses):
-                    if start_addr == position_addr:
-                        wave_file = wav_files[j]
-                        break
-            else:
-                wave_file = "Not assigned"
-            
-            self.append_log(f"{label.ljust(20)}| {wave_file.ljust(60)}")
-        
-        self.append_log("-" * LOG_WIDTH)
-        
     def handle_no_wav_files(self):
         """Handle case when no WAV files are found"""
-        QMessageBox.warning(self, "No WAV Files", "No WAV files found in the selected folder.")
-        self.enable_buttons() 
\ No newline at end of file
+        self.enable_buttons()
+        self._show_warning("No WAV Files", "No WAV files found in the selected folder.")
+    
+    def handle_conversion_failed(self, errors):
+        """Show all WAV files that failed to convert"""
+        details = "\n".join(f"{wav_file}: {error}" for wav_file, error in errors)
+        self._show_warning("Conversion Failed",
+                           f"{len(errors)} WAV file(s) could not be converted. No output files were created.\n\n{details}")
+    
+    def handle_conversion_partial(self, errors):
+        """Ask whether to continue with the WAV files that were converted"""
+        details = "\n".join(f"{wav_file}: {error}" for wav_file, error in errors)
+        reply = QMessageBox.question(self, "Conversion Failed",
+                                     f"{len(errors)} WAV file(s) could not be converted:\n\n{details}\n\n"
+                                     "Continue with the converted files?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        
+        if reply == QMessageBox.Yes:
+            # Continue without the failed files (ProcessingThread resumes on its worker thread)
+            self.processing_thread.continue_with_converted_files()
+        else:
+            self.append_log("Processing stopped, no output files were created")
+            self.processing_thread.finished.emit() 
\ No newline at end of file
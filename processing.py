@@ -9,16 +9,19 @@
 📌 Main Features:
     - ProcessingThread: Background audio processing thread
     - AddressSettingDialog: Engine sound address setting dialog
+    - LogSaveWorker: Saves the CSV log on a QThreadPool thread
     - Manages full process: WAV → FLAC → HEX → merge → file save
     - Branches flow by sound type (Engine vs Event)
     
 📌 ProcessingThread Key Methods:
     - run(): Main processing logic (WAV validation → conversion → merge → save)
-    - _convert_wav_files(): Convert WAV files to FLAC and then to HEX
+    - _convert_wav_files(): Convert WAV files to FLAC and then to HEX (parallel workers)
+    - continue_with_converted_files(): Continue without the files that failed to convert
     - _merge_and_save_files(): Merge HEX data and save files
     - _show_engine_address_dialog(): Show engine address dialog
     - complete_engine_processing(): Complete engine sound processing
-    - _finalize_processing(): Finalize and cleanup
+    - _log_engine_sound_positions(): Log engine sound position table
+    - _finalize_processing(): Save the run log (single CSV) and finish
     
 📌 AddressSettingDialog Key Features:
     - Table of start addresses for each WAV file
@@ -29,35 +32,38 @@
 📌 Processing Flow:
     Engine Sound: WAV→Dialog→User setting→Merge/Save
     Event Sound: WAV→File info log→Merge/Save
+    Some WAV files failed: User choice→Continue with converted files (or stop)
     
 📌 Dependencies:
-    - Standard library: os
+    - Standard library: os, struct, array, concurrent.futures
     - PyQt5: QDialog, QThread, QTableWidget, etc.
-    - External library: intelhex
-    - Local modules: utils, audio_processor, file_manager
+    - Local modules: utils, config, audio_processor, file_manager
 =========================================================================================
 """
 
 import os
+import struct
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QGridLayout, QGroupBox, 
                             QTableWidget, QTableWidgetItem, QLabel, QLineEdit, 
                             QPushButton, QMessageBox, QSizePolicy)
-from PyQt5.QtCore import QThread, pyqtSignal, QRegExp, Qt
+from PyQt5.QtCore import QThread, QObject, QRunnable, pyqtSignal, QRegExp, Qt
 from PyQt5.QtGui import QRegExpValidator
-from intelhex import IntelHex
 from utils import (LOG_WIDTH, AudioConstants, UIConstants, AudioFileError, 
                   FlacConversionError, HexDataError, ProcessingError)
-from audio_processor import AudioProcessor, HexMerger
 from file_manager import FileManager, LogManager
+from config import app_settings
 
 class ProcessingThread(QThread):
     """Audio file processing thread (refactored version)"""
     
     finished = pyqtSignal()
-    log_message = pyqtSignal(str)
-    save_log = pyqtSignal()
+    log_messages = pyqtSignal(list)    # Several log lines in one cross-thread signal
     show_info_dialog = pyqtSignal(list, list, list)
     no_wav_files = pyqtSignal()
+    conversion_failed = pyqtSignal(list)    # [(wav_file, error message), ...]
+    conversion_partial = pyqtSignal(list)   # Same, when the other files were converted
     
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -75,7 +81,14 @@ class ProcessingThread(QThread):
         # Processing result data
         self.hex_data_list = []
         self.wav_files = []
+        self.wav_file_paths = []
+        self.wav_file_sizes = []
         self.start_addresses = []
+        self.conversion_errors = []
+        self._resume_with_converted_files = False  # Next run() continues after a partial conversion
+        
+        # Log lines waiting to be sent to the GUI (flushed at phase boundaries)
+        self._log_buffer = []
         
         # Processing objects
         self.audio_processor = None
@@ -97,66 +110,136 @@ class ProcessingThread(QThread):
         
     def _init_processors(self):
         """Initialize processing objects"""
-        self.audio_processor = AudioProcessor(self.compression_level, self.block_size)
+        # numpy/libFLAC 모듈은 첫 처리 시작 시에만 로드 (GUI 시작 시간 단축)
+        from audio_processor import HexMerger
+        self.audio_processor = None  # Created in run() (loads libFLAC)
         self.hex_merger = HexMerger(self.sound_type, self.hex_start_address)
         self.file_manager = FileManager(self.sound_type)
         self.log_manager = LogManager(self.sound_type)
         
     def run(self):
         """Main processing logic"""
+        if self._resume_with_converted_files:
+            # Restarted after a partial conversion: only the output generation is left
+            self._resume_with_converted_files = False
+            self._continue_with_converted_files()
+            return
+        
         try:
-            self.log_message.emit("Starting processing")
+            self._log("Starting processing")
             self.log_manager.add_log_entry("Processing started")
             
             # 1. Find and validate WAV files
             if not self._find_and_validate_wav_files():
+                self._emit_finished()
                 return
             
             # 2. Prepare output folder
             if not self._prepare_output_folder():
+                self._emit_finished()
+                return
+            
+            # 2.5. Create audio processor (libFLAC is loaded and checked once here)
+            if not self._init_audio_processor():
+                self._emit_finished()
                 return
             
             # 3. Convert WAV → FLAC → HEX
             if not self._convert_wav_files():
+                if self.conversion_errors:
+                    self.conversion_failed.emit(self.conversion_errors)
+                self._emit_finished()
                 return
             
-            # 3.5. Output file info log (both Engine and Event Sound)
-            self._log_file_info()
+            if self.conversion_errors:
+                # Some files failed: the user decides whether to continue with the converted files
+                self.conversion_partial.emit(self.conversion_errors)
+                return
             
-            # 4. Branch by sound type
-            if self.sound_type == "Engine Sound":
-                # Engine sound: show AddressSettingDialog, then continue
-                self._show_engine_address_dialog()
-            else:
-                # Event sound: merge/save immediately
-                if not self._merge_and_save_files():
-                    return
-                self._finalize_processing()
+            self._generate_output_files()
             
         except Exception as e:
             error_msg = f"Error in processing thread: {str(e)}"
-            self.log_message.emit(error_msg)
+            self._log(error_msg)
+            self.log_manager.add_log_entry(f"Error: {str(e)}")
+            self._emit_finished()  # Emit finished signal even on error
+    
+    def _generate_output_files(self):
+        """File info log, then branch by sound type"""
+        # 3.5. Output file info log (both Engine and Event Sound)
+        self._log_file_info()
+        
+        # 4. Branch by sound type
+        if self.sound_type == "Engine Sound":
+            # Engine sound: show AddressSettingDialog, then continue
+            self._show_engine_address_dialog()
+        else:
+            # Event sound: merge/save immediately
+            if not self._merge_and_save_files():
+                self._emit_finished()
+                return
+            self._finalize_processing()
+    
+    def continue_with_converted_files(self):
+        """Resume on the worker thread with the converted files only (called after partial conversion)"""
+        self.wait()  # run() returns right after emitting conversion_partial
+        self._resume_with_converted_files = True
+        self.start()
+    
+    def _continue_with_converted_files(self):
+        """Generate output files from the converted files only"""
+        try:
+            self._log(f"Continuing with {len(self.wav_files)} converted files")
+            self.log_manager.add_log_entry(f"Continuing with {len(self.wav_files)} converted files")
+            self._generate_output_files()
+        except Exception as e:
+            self._log(f"Error in processing thread: {str(e)}")
             self.log_manager.add_log_entry(f"Error: {str(e)}")
-            self.finished.emit()  # Emit finished signal even on error
+            self._emit_finished()
             
+    def _log(self, message: str):
+        """Queue a log line for the GUI (sent by _flush_log)"""
+        self._log_buffer.append(message)
+    
+    def _flush_log(self):
+        """Send queued log lines to the GUI in one signal"""
+        if self._log_buffer:
+            # Hand over the list and start a new one (the GUI thread keeps the reference)
+            self.log_messages.emit(self._log_buffer)
+            self._log_buffer = []
+    
+    def _emit_finished(self):
+        """Flush pending log lines, then signal that processing has finished"""
+        self._flush_log()
+        self.finished.emit()
+    
     def _find_and_validate_wav_files(self) -> bool:
         """Find and validate WAV files"""
         try:
-            if not os.path.exists(self.input_folder):
+            # Single directory walk (DirEntry carries name, path and size; no separate exists() stat)
+            try:
+                with os.scandir(self.input_folder) as entries:
+                    # Suffix check first (no stat), extension matched case-insensitively (.wav/.WAV)
+                    wav_entries = [entry for entry in entries
+                                   if entry.name.lower().endswith(".wav") and entry.is_file()]
+            except FileNotFoundError:
                 raise ProcessingError(f"Input folder does not exist: {self.input_folder}")
-                
-            self.wav_files = [f for f in os.listdir(self.input_folder) if f.endswith(".wav")]
+            
+            self.wav_files = [entry.name for entry in wav_entries]
+            self.wav_file_paths = [entry.path for entry in wav_entries]
+            self.wav_file_sizes = [entry.stat().st_size for entry in wav_entries]
             
             if not self.wav_files:
+                self._flush_log()
                 self.no_wav_files.emit()
                 return False
                 
-            self.log_message.emit(f"Found {len(self.wav_files)} WAV files")
+            self._log(f"Found {len(self.wav_files)} WAV files")
             self.log_manager.add_log_entry(f"Found {len(self.wav_files)} WAV files")
             return True
             
         except Exception as e:
-            self.log_message.emit(f"Error finding WAV files: {str(e)}")
+            self._log(f"Error finding WAV files: {str(e)}")
             self.log_manager.add_log_entry(f"Error finding WAV files: {str(e)}")
             return False
     
@@ -164,48 +247,86 @@ class ProcessingThread(QThread):
         """Prepare output folder"""
         try:
             output_folder = self.file_manager.ensure_output_folder_exists()
-            self.log_message.emit(f"Output folder path: {output_folder}")
+            self._log(f"Output folder path: {output_folder}")
             self.log_manager.add_log_entry(f"Output folder path: {output_folder}")
             return True
             
         except Exception as e:
-            self.log_message.emit(f"Error preparing output folder: {str(e)}")
+            self._log(f"Error preparing output folder: {str(e)}")
             self.log_manager.add_log_entry(f"Error preparing output folder: {str(e)}")
             return False
     
+    def _init_audio_processor(self) -> bool:
+        """Create the audio processor (fails once here if libFLAC is missing, not once per file)"""
+        from audio_processor import AudioProcessor
+        try:
+            self.audio_processor = AudioProcessor(self.compression_level, self.block_size)
+            return True
+            
+        except FlacConversionError as e:
+            self._log(f"Error loading FLAC encoder: {str(e)}")
+            self.log_manager.add_log_entry(f"Error loading FLAC encoder: {str(e)}")
+            return False
+    
     def _convert_wav_files(self) -> bool:
         """Convert WAV files to FLAC and then to HEX data"""
         try:
-            self.log_message.emit("\n" + "=" * LOG_WIDTH)
+            self._log("\n" + "=" * LOG_WIDTH)
             self.log_manager.add_log_entry(f"=" * LOG_WIDTH)
-            self.log_message.emit("[ File Conversion ]")
+            self._log("[ File Conversion ]")
             self.log_manager.add_log_entry(f"[ File Conversion ]")
-            self.log_message.emit("=" * LOG_WIDTH)
+            self._log("=" * LOG_WIDTH)
             
             self.hex_data_list = []
             self.start_addresses = []
+            self.conversion_errors = []
+            converted_indexes = []
             
             # Calculate initial address
             base_address = int(self.hex_start_address, 16)
             current_address = self._calculate_initial_address(base_address)
             
-            # Process each WAV file
-            for wav_file in self.wav_files:
-                if not self._process_single_wav_file(wav_file, current_address):
-                    return False
+            # Convert WAV files in parallel (each conversion is independent)
+            max_workers = min(app_settings.get_max_workers(), len(self.wav_files))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit largest files first so a long conversion does not start last
+                futures = [None] * len(self.wav_files)
+                for i in sorted(range(len(self.wav_files)), key=lambda i: self.wav_file_sizes[i], reverse=True):
+                    futures[i] = executor.submit(self._convert_single_wav_file, self.wav_file_paths[i], self.wav_files[i])
+                
+                # Collect results in input order (addresses are assigned sequentially)
+                for i, (wav_file, future) in enumerate(zip(self.wav_files, futures)):
+                    if not self._process_single_wav_file(wav_file, future, current_address):
+                        continue  # Keep converting the rest, failures are reported together
+                    converted_indexes.append(i)
                     
-                # Calculate address for next file
-                if self.hex_data_list:
+                    # Calculate address for next file
                     hex_data = self.hex_data_list[-1]
                     current_address += len(hex_data)
                     current_address = self._align_address(current_address)
             
+            if self.conversion_errors:
+                failed_message = f"Conversion failed for {len(self.conversion_errors)} of {len(self.wav_files)} files"
+                if not converted_indexes:
+                    failed_message += ", no output files created"
+                self._log(failed_message)
+                self.log_manager.add_log_entry(failed_message)
+                if not converted_indexes:
+                    return False
+                
+                # Keep only the converted files (addresses were assigned to them only)
+                self.wav_files = [self.wav_files[i] for i in converted_indexes]
+                self.wav_file_paths = [self.wav_file_paths[i] for i in converted_indexes]
+                self.wav_file_sizes = [self.wav_file_sizes[i] for i in converted_indexes]
+            
             return True
             
         except Exception as e:
-            self.log_message.emit(f"Error during conversion: {str(e)}")
+            self._log(f"Error during conversion: {str(e)}")
             self.log_manager.add_log_entry(f"Conversion error: {str(e)}")
             return False
+        finally:
+            self._flush_log()
     
     def _calculate_initial_address(self, base_address: int) -> int:
         """Calculate initial address"""
@@ -214,76 +335,79 @@ class ProcessingThread(QThread):
         else:  # Event Sound
             return base_address + AudioConstants.EVENT_HEADER_SIZE
     
-    def _process_single_wav_file(self, wav_file: str, current_address: int) -> bool:
-        """Process a single WAV file"""
-        wav_file_path = os.path.join(self.input_folder, wav_file)
+    def _convert_single_wav_file(self, wav_file_path: str, wav_file: str) -> bytes:
+        """Convert a single WAV file to HEX data (runs in a worker thread, no signals)"""
+        # WAV → FLAC conversion
+        flac_data = self.audio_processor.wav_to_flac(wav_file_path)
         
+        # FLAC → HEX data conversion
+        return self.audio_processor.create_hex_data(flac_data, self.sound_type, wav_file)
+    
+    def _process_single_wav_file(self, wav_file: str, future, current_address: int) -> bool:
+        """Collect the conversion result of a single WAV file"""
         try:
-            # WAV → FLAC conversion
-            flac_data = self.audio_processor.wav_to_flac(wav_file_path)
-            
-            # FLAC → HEX data conversion
-            hex_data = self.audio_processor.create_hex_data(flac_data, self.sound_type, wav_file)
+            hex_data = future.result()
             
             # Save result
             self.hex_data_list.append(hex_data)
             self.start_addresses.append(current_address)
             
             # Log message
-            self.log_message.emit(f"Converted successfully : {wav_file}")
+            self._log(f"Converted successfully : {wav_file}")
             self.log_manager.add_log_entry(f"Converted successfully: {wav_file}")
             
             return True
             
         except (AudioFileError, FlacConversionError) as e:
-            self.log_message.emit(f"Conversion Failed : {wav_file} : {str(e)}")
+            self._log(f"Conversion Failed : {wav_file} : {str(e)}")
             self.log_manager.add_log_entry(f"Conversion Failed: {wav_file} - {str(e)}")
+            self.conversion_errors.append((wav_file, str(e)))
             return False
         except Exception as e:
-            self.log_message.emit(f"Unexpected error processing {wav_file}: {str(e)}")
+            self._log(f"Unexpected error processing {wav_file}: {str(e)}")
             self.log_manager.add_log_entry(f"Unexpected error: {wav_file} - {str(e)}")
+            self.conversion_errors.append((wav_file, str(e)))
             return False
     
     def _align_address(self, address: int) -> int:
         """Align address to 4-byte boundary"""
-        if address % AudioConstants.WORD_ALIGNMENT != 0:
-            address += AudioConstants.WORD_ALIGNMENT - (address % AudioConstants.WORD_ALIGNMENT)
-        return address
+        return address + ((-address) & AudioConstants.WORD_ALIGNMENT_MASK)
     
     def _log_file_info(self):
         """Output file info table to log and save to CSV"""
         try:
-            self.log_message.emit("\n" + "-" * LOG_WIDTH)
-            self.log_message.emit(f"{'File Name':<50} | {'Start Address':>13} | {'Data Length':>11}")
-            self.log_manager.add_log_entry(f"{'File Name':<50} | {'Start Address':>13} | {'Data Length':>11}")
-            self.log_message.emit("-" * LOG_WIDTH)
+            self._log("\n" + "-" * LOG_WIDTH)
+            self._log(f"{'File Name':<50} | {'Start Address':>13} | {'Data Length':>11}")
+            self.log_manager.add_log_row("File Name", "Start Address", "Data Length")
+            self._log("-" * LOG_WIDTH)
             self.log_manager.add_log_entry(f"-" * LOG_WIDTH)
             
-            for i, (wav_file, start_addr, hex_data) in enumerate(zip(self.wav_files, self.start_addresses, self.hex_data_list)):
-                file_name = os.path.basename(wav_file)
+            # wav_files already holds bare file names (paths are kept in wav_file_paths)
+            for file_name, start_addr, hex_data in zip(self.wav_files, self.start_addresses, self.hex_data_list):
                 file_name_formatted = f"{file_name:<50}"
                 start_address_formatted = f"0x{start_addr:08X}"
                 data_length_formatted = f"0x{len(hex_data):08X}"
-                self.log_message.emit(f"{file_name_formatted} | {start_address_formatted:>13} | {data_length_formatted:>11}")
+                self._log(f"{file_name_formatted} | {start_address_formatted:>13} | {data_length_formatted:>11}")
                 
-                # Save file info to CSV with '|' separator
-                file_info_message = f"{file_name} | {start_address_formatted} | {data_length_formatted}"
-                self.log_manager.add_log_entry(file_info_message)
+                # Save file info to CSV as separate columns
+                self.log_manager.add_log_row(file_name, start_address_formatted, data_length_formatted)
             
-            self.log_message.emit("-" * LOG_WIDTH)
+            self._log("-" * LOG_WIDTH)
             self.log_manager.add_log_entry(f"-" * LOG_WIDTH)
             
         except Exception as e:
-            self.log_message.emit(f"Error logging file info: {str(e)}")
+            self._log(f"Error logging file info: {str(e)}")
+        finally:
+            self._flush_log()
     
     def _merge_and_save_files(self) -> bool:
         """Merge HEX data and save files"""
         try:
-            self.log_message.emit("\n" + "=" * LOG_WIDTH)
+            self._log("\n" + "=" * LOG_WIDTH)
             self.log_manager.add_log_entry(f"=" * LOG_WIDTH)
-            self.log_message.emit("[ File Generation ]")
+            self._log("[ File Generation ]")
             self.log_manager.add_log_entry(f"[ File Generation ]")
-            self.log_message.emit("=" * LOG_WIDTH)
+            self._log("=" * LOG_WIDTH)
             self.log_manager.add_log_entry(f"=" * LOG_WIDTH)
 
             # Process sound positions (engine sound only)
@@ -296,17 +420,17 @@ class ProcessingThread(QThread):
             return self._save_output_files(merged_hex)
             
         except Exception as e:
-            self.log_message.emit(f"Error during merge and save: {str(e)}")
+            self._log(f"Error during merge and save: {str(e)}")
             self.log_manager.add_log_entry(f"Merge/save error: {str(e)}")
             return False
     
-    def _get_sound_positions(self) -> list:
-        """Get sound positions (engine sound only)"""
+    def _get_sound_positions(self):
+        """Get sound positions as 32-bit addresses (engine sound only)"""
         if self.sound_type == "Engine Sound":
-            return [hex(addr)[2:].upper().zfill(8) for addr in self.start_addresses]
+            return array('I', self.start_addresses)
         return None
     
-    def _save_output_files(self, merged_hex: IntelHex) -> bool:
+    def _save_output_files(self, merged_hex: bytearray) -> bool:
         """Save output files"""
         try:
             if self.sound_type == "Engine Sound":
@@ -315,57 +439,57 @@ class ProcessingThread(QThread):
                 return self._save_event_files(merged_hex)
                 
         except Exception as e:
-            self.log_message.emit(f"Error saving files: {str(e)}")
+            self._log(f"Error saving files: {str(e)}")
             self.log_manager.add_log_entry(f"File save error: {str(e)}")
             return False
     
-    def _save_engine_files(self, merged_hex: IntelHex) -> bool:
+    def _save_engine_files(self, merged_hex: bytearray) -> bool:
         """Save engine sound files"""
         try:
             # Calculate total FLAC data size
             total_flac_size = 0
-            for temp_ih in self.hex_data_list:
+            for hex_data in self.hex_data_list:
                 # Calculate FLAC data size (excluding 4-byte header)
-                flac_size = (temp_ih[0x0000] | (temp_ih[0x0001] << 8) | (temp_ih[0x0002] << 16) | (temp_ih[0x0003] << 24))
+                flac_size = struct.unpack_from('<I', hex_data, 0)[0]
                 total_flac_size += flac_size
             
             # Save BIN file
             bin_filename = self.file_manager.save_bin_file(merged_hex)
-            self.log_message.emit(f"Total data size: {total_flac_size:,} bytes")
+            self._log(f"Total data size: {total_flac_size:,} bytes")
             self.log_manager.add_log_entry(f"Total data size: {total_flac_size:,} bytes")
-            self.log_message.emit(f"Created BIN file: {bin_filename}")
+            self._log(f"Created BIN file: {bin_filename}")
             self.log_manager.add_log_entry(f"Created BIN: {bin_filename}")
             
             # Save header file
             header_filename = self.file_manager.save_header_file(merged_hex)
-            self.log_message.emit(f"Created header file: {header_filename}")
+            self._log(f"Created header file: {header_filename}")
             self.log_manager.add_log_entry(f"Created header: {header_filename}")
             
             return True
             
         except Exception as e:
-            self.log_message.emit(f"Error saving engine files: {str(e)}")
+            self._log(f"Error saving engine files: {str(e)}")
             return False
     
-    def _save_event_files(self, merged_hex: IntelHex) -> bool:
+    def _save_event_files(self, merged_hex: bytearray) -> bool:
         """Save event sound files"""
         try:
             # Save HEX file
-            hex_filename = self.file_manager.save_hex_file(merged_hex)
+            hex_filename = self.file_manager.save_hex_file(merged_hex, self.hex_merger.start_address)
             
             # Output HEX file size (first)
-            hex_file_size = merged_hex.maxaddr() - merged_hex.minaddr() + 1
-            self.log_message.emit(f"HEX file size: {hex_file_size:,} bytes ({hex_file_size/1024:.2f} KB)")
+            hex_file_size = len(merged_hex)
+            self._log(f"HEX file size: {hex_file_size:,} bytes ({hex_file_size/1024:.2f} KB)")
             self.log_manager.add_log_entry(f"HEX size: {hex_file_size} bytes")
             
             # Output created file name (after)
-            self.log_message.emit(f"Created HEX file: {hex_filename}")
+            self._log(f"Created HEX file: {hex_filename}")
             self.log_manager.add_log_entry(f"Created HEX: {hex_filename}")
             
             return True
             
         except Exception as e:
-            self.log_message.emit(f"Error saving event files: {str(e)}")
+            self._log(f"Error saving event files: {str(e)}")
             return False
     
     def _show_engine_address_dialog(self):
@@ -373,59 +497,117 @@ class ProcessingThread(QThread):
         try:
             # Default sound positions (10 slots, all FFFFFFFF)
             sound_positions = ["FFFFFFFF"] * 10
+            self._flush_log()
             self.show_info_dialog.emit(self.wav_files, self.start_addresses, sound_positions)
         except Exception as e:
-            self.log_message.emit(f"Error showing address dialog: {str(e)}")
-            self.finished.emit()
+            self._log(f"Error showing address dialog: {str(e)}")
+            self._emit_finished()
     
     def complete_engine_processing(self, updated_positions):
         """Complete engine sound processing (called from AddressSettingDialog)"""
+        self._log_engine_sound_positions(updated_positions or [])
+        
+        self._log("\n" + "=" * LOG_WIDTH)
+        self._log("[ File Generation ]")
+        self._log("=" * LOG_WIDTH)
+        
+        # Update start addresses if they were changed in dialog
+        if updated_positions:
+            for i, position in enumerate(updated_positions):
+                if i < len(self.start_addresses):
+                    try:
+                        self.start_addresses[i] = int(position, 16)
+                    except ValueError:
+                        pass  # Keep original address if conversion fails
+        
+        # Merge with updated positions (saving and finalizing handle their own errors)
         try:
-            self.log_message.emit("\n" + "=" * LOG_WIDTH)
-            self.log_message.emit("[ File Generation ]")
-            self.log_message.emit("=" * LOG_WIDTH)
-            
-            # Update start addresses if they were changed in dialog
-            if updated_positions:
-                for i, position in enumerate(updated_positions):
-                    if i < len(self.start_addresses):
-                        try:
-                            self.start_addresses[i] = int(position, 16)
-                        except ValueError:
-                            pass  # Keep original address if conversion fails
-            
-            # Merge with updated positions
-            merged_hex = self.hex_merger.merge_hex_data_list(self.hex_data_list, updated_positions)
-            
-            # Save files
-            if self._save_engine_files(merged_hex):
-                self._finalize_processing()
-            else:
-                self.finished.emit()
-                
+            positions = array('I', (int(position, 16) for position in updated_positions or []))
+            merged_hex = self.hex_merger.merge_hex_data_list(self.hex_data_list, positions)
         except Exception as e:
-            self.log_message.emit(f"Error completing engine processing: {str(e)}")
-            self.finished.emit()
+            self._log(f"Error completing engine processing: {str(e)}")
+            self._emit_finished()
+            return
+        
+        # Save files
+        if self._save_engine_files(merged_hex):
+            self._finalize_processing()
+        else:
+            self._emit_finished()
 
+    def _log_engine_sound_positions(self, sound_positions):
+        """Output engine sound position info to log"""
+        log_lines = [
+            "\n" + "< Engine Sound Position Information >",
+            "-" * LOG_WIDTH,
+            f"{'Position'.center(20)}|{'Wave File'.center(60)}",
+            "-" * LOG_WIDTH
+        ]
+        
+        position_labels = [
+            "Sound F1 ", "Sound F2 ", "Sound F3 ",
+            "Sound S1 ", "Sound S2 ", "Sound S3 ",
+            "Sound C1 ", "Sound C2 ",
+            "Sound R1 ", "Sound R2 "
+        ]
+        
+        # Start address -> WAV file (addresses are unique)
+        wav_file_by_address = dict(zip(self.start_addresses, self.wav_files))
+        
+        for label, position in zip(position_labels, sound_positions):
+            if position.upper() != "FFFFFFFF":
+                # Find matching WAV file for this address
+                wave_file = wav_file_by_address.get(int(position, 16), "Not found")
+            else:
+                wave_file = "Not assigned"
+            
+            log_lines.append(f"{label.ljust(20)}| {wave_file.ljust(60)}")
+        
+        log_lines.append("-" * LOG_WIDTH)
+        for line in log_lines:
+            self._log(line)
+            self.log_manager.add_log_entry(line.strip())
+    
     def _finalize_processing(self):
         """Finalize and cleanup"""
         try:
-            # Auto-save log
+            # Auto-save log (the run's single log file)
+            self.log_manager.add_log_entry("Processing completed successfully")
             log_filename, _ = self.log_manager.save_log_to_csv(manual_save=False)
-            self.log_message.emit(f"Log saved: {log_filename}")
+            self._log(f"Log saved: {log_filename}")
             
             # Completion message
-            self.log_message.emit("\nProcessing completed successfully")
-            
-            # Auto-save log signal
-            self.save_log.emit()
+            self._log("\nProcessing completed successfully")
             
             # Thread finished
-            self.finished.emit()
+            self._emit_finished()
             
         except Exception as e:
-            self.log_message.emit(f"Error during finalization: {str(e)}")
-            self.finished.emit()
+            self._log(f"Error during finalization: {str(e)}")
+            self._emit_finished()
+
+class LogSaveSignals(QObject):
+    """Signals of LogSaveWorker (QRunnable cannot emit signals itself)"""
+    
+    saved = pyqtSignal(str, bool)    # log filename, manual save
+    failed = pyqtSignal(str)         # error message
+
+class LogSaveWorker(QRunnable):
+    """Save log entries to CSV off the GUI thread"""
+    
+    def __init__(self, log_manager, manual_save: bool):
+        super().__init__()
+        self.log_manager = log_manager
+        self.manual_save = manual_save
+        self.signals = LogSaveSignals()
+    
+    def run(self):
+        """Write the CSV file and report the result to the GUI"""
+        try:
+            log_filename, is_manual = self.log_manager.save_log_to_csv(manual_save=self.manual_save)
+            self.signals.saved.emit(log_filename, is_manual)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
 
 class AddressSettingDialog(QDialog):
     """Address setting dialog (legacy feature maintained)"""
@@ -531,6 +713,8 @@ class AddressSettingDialog(QDialog):
         if hasattr(self, 'position_edits'):
             # List for address matching check
             unmatched_positions = []
+            # Start address -> WAV file (addresses are unique)
+            wav_file_by_address = dict(zip(self.start_addresses, self.wav_files))
             
             # Output position labels and values
             position_labels = [
@@ -547,11 +731,7 @@ class AddressSettingDialog(QDialog):
                     try:
                         position_addr = int(position_value, 16)
                         # Find matching WAV file for this address
-                        wave_file = "Not found"
-                        for j, start_addr in enumerate(self.start_addresses):
-                            if start_addr == position_addr:
-                                wave_file = self.wav_files[j]
-                                break
+                        wave_file = wav_file_by_address.get(position_addr, "Not found")
                         if wave_file == "Not found":
                             unmatched_positions.append(label.strip())
                     except ValueError:
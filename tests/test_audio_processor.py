@@ -0,0 +1,96 @@
+"""
+=========================================================================================
+📌 File:         test_audio_processor.py
+📌 Description:  Tests for AudioProcessor FLAC conversion cache
+=========================================================================================
+"""
+
+import os
+import sys
+import time
+import wave
+import struct
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import audio_processor
+
+
+class CountingFlacEncoder:
+    """Stand-in for FlacEncoder (no libFLAC needed): counts encode() calls"""
+
+    def __init__(self, compression_level, block_size):
+        self.encode_count = 0
+        self._lock = threading.Lock()
+
+    def encode(self, samples, sample_rate, bits_per_sample):
+        with self._lock:
+            self.encode_count += 1
+        # Long enough for every worker to reach the cache while the first encode runs
+        time.sleep(0.2)
+        return b"fLaC" + samples.tobytes()
+
+
+class FlacCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        patcher = mock.patch.object(audio_processor, "FlacEncoder", CountingFlacEncoder)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._tmp.cleanup)
+
+    def _write_wav(self, name, samples, sample_rate=24000):
+        path = os.path.join(self._tmp.name, name)
+        with wave.open(path, 'wb') as wav_file:
+            wav_file.setnchannels(1)
+            wav_file.setsampwidth(2)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(struct.pack(f'<{len(samples)}h', *samples))
+        return path
+
+    def test_parallel_duplicates_are_encoded_once(self):
+        num_workers = 4
+        samples = [(i * 37) % 2000 - 1000 for i in range(4800)]
+        paths = [self._write_wav(f"DUP{i}.WAV", samples) for i in range(num_workers)]
+        processor = audio_processor.AudioProcessor()
+
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            results = list(executor.map(processor.wav_to_flac, paths))
+
+        self.assertEqual(processor.flac_encoder.encode_count, 1)
+        self.assertTrue(all(result == results[0] for result in results))
+
+    def test_different_contents_are_encoded_separately(self):
+        paths = [self._write_wav("A.WAV", [1, 2, 3, 4]), self._write_wav("B.WAV", [4, 3, 2, 1])]
+        processor = audio_processor.AudioProcessor()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(processor.wav_to_flac, paths))
+
+        self.assertEqual(processor.flac_encoder.encode_count, 2)
+        self.assertNotEqual(results[0], results[1])
+
+    def test_failed_encode_is_reported_to_waiting_duplicates(self):
+        paths = [self._write_wav(f"BAD{i}.WAV", [5, 6, 7, 8]) for i in range(3)]
+        processor = audio_processor.AudioProcessor()
+
+        def failing_encode(samples, sample_rate, bits_per_sample):
+            time.sleep(0.2)
+            raise audio_processor.FlacConversionError("encoder failed")
+        processor.flac_encoder.encode = failing_encode
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(processor.wav_to_flac, path) for path in paths]
+            for future in futures:
+                with self.assertRaises(audio_processor.FlacConversionError):
+                    future.result()
+
+
+if __name__ == "__main__":
+    unittest.main()
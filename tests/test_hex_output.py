@@ -0,0 +1,150 @@
+"""
+=========================================================================================
+📌 File:         test_hex_output.py
+📌 Description:  Tests for merged image layout, Intel HEX and C header output
+=========================================================================================
+"""
+
+import os
+import sys
+import struct
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import app_settings
+from utils import AudioConstants
+from file_manager import FileManager
+from audio_processor import HexMerger
+
+try:
+    from intelhex import IntelHex
+except ImportError:
+    IntelHex = None
+
+# Reference output of IntelHex.write_hex_file(write_start_addr=False)
+REFERENCE_HEX_64KB_BOUNDARY = (
+    ":020000040000FA\n"
+    ":0AFFF60000010203040506070809D4\n"
+    ":020000040001F9\n"
+    ":100000000A0B0C0D0E0F10111213141516171819D8\n"
+    ":0E0010001A1B1C1D1E1F20212223242526271B\n"
+    ":00000001FF\n"
+)
+REFERENCE_HEX_UNALIGNED_START = (
+    ":1010030000070E151C232A31383F464D545B626995\n"
+    ":1010130070777E858C939AA1A8AFB6BDC4CBD2D985\n"
+    ":05102300E0E7EEF5FC22\n"
+    ":00000001FF\n"
+)
+
+
+class OutputFolderTestCase(unittest.TestCase):
+    """Output files go to a temporary folder"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        for name, value in (("use_default_path", False), ("custom_output_path", self._tmp.name)):
+            patcher = mock.patch.object(app_settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.file_manager = FileManager("Event Sound")
+        self.file_manager.ensure_output_folder_exists()
+
+    def _read_output(self, filename, mode='r'):
+        with open(os.path.join(self.file_manager.get_output_folder_path(), filename), mode) as f:
+            return f.read()
+
+
+class IntelHexOutputTest(OutputFolderTestCase):
+
+    def _save_hex(self, image, start_address, filename="test.hex"):
+        self.file_manager.save_hex_file(image, start_address, filename)
+        return self._read_output(filename)
+
+    def test_records_across_64kb_boundary(self):
+        self.assertEqual(self._save_hex(bytes(range(40)), 0xFFF6), REFERENCE_HEX_64KB_BOUNDARY)
+
+    def test_records_from_unaligned_start(self):
+        image = bytes((i * 7) & 0xFF for i in range(37))
+        self.assertEqual(self._save_hex(image, 0x1003), REFERENCE_HEX_UNALIGNED_START)
+
+    @unittest.skipIf(IntelHex is None, "intelhex is not installed")
+    def test_matches_intelhex(self):
+        image = bytes((i * 131 + (i >> 8)) & 0xFF for i in range(3 * 0x10000 + 0x123))
+        for start_address in (0x00001000, 0x0000FFFD, 0x10118000, 0x1011FFF3):
+            with self.subTest(start_address=hex(start_address)):
+                self._save_hex(image, start_address)
+
+                ih = IntelHex()
+                ih.frombytes(image, offset=start_address)
+                reference_path = os.path.join(self.file_manager.get_output_folder_path(), "reference.hex")
+                ih.write_hex_file(reference_path, write_start_addr=False)
+
+                self.assertEqual(self._read_output("test.hex", 'rb'), self._read_output("reference.hex", 'rb'))
+
+
+class CHeaderOutputTest(OutputFolderTestCase):
+
+    def test_data_rows_match_per_byte_format(self):
+        image = bytes((i * 13) & 0xFF for i in range(50))
+        self.file_manager.save_header_file(image, "test.h")
+        content = self._read_output("test.h")
+
+        # Per-byte reference (format of the original per-byte writer)
+        reference = ""
+        for i, value in enumerate(image):
+            if i % 16 == 0:
+                reference += "    "
+            reference += f"0x{value:02X}"
+            if i < len(image) - 1:
+                reference += ", "
+                if (i + 1) % 16 == 0:
+                    reference += "\n"
+        self.assertIn(f"const uint8_t engine_sound_data[{len(image)}] = {{\n{reference}\n}};\n", content)
+        self.assertIn(f"#define ENGINE_SOUND_DATA_SIZE {len(image)}\n", content)
+
+
+class MergedImageLayoutTest(unittest.TestCase):
+
+    def test_engine_image_layout(self):
+        start_address = int(AudioConstants.DEFAULT_START_ADDRESS, 16)
+        payloads = [b"\x01" * 5, b"\x02" * 7, b"\x03" * 8]
+        positions = array('I', [0x1011802C, 0x10118034, 0x1011803C] + [0xFFFFFFFF] * 7)
+
+        merger = HexMerger("Engine Sound", AudioConstants.DEFAULT_START_ADDRESS)
+        image = merger.merge_hex_data_list(payloads, positions)
+
+        # Fixed 864KB image
+        self.assertEqual(len(image), AudioConstants.ENGINE_HEX_FILE_SIZE)
+        # Header: magic key + 10 sound positions (little endian)
+        self.assertEqual(struct.unpack_from('<11I', image, 0), (AudioConstants.MAGIC_KEY, *positions))
+
+        # Payloads start at 4-byte aligned addresses, gaps are 0xFF
+        offset = AudioConstants.ENGINE_HEADER_SIZE
+        for payload, position in zip(payloads, positions):
+            self.assertEqual(offset % 4, 0)
+            self.assertEqual(start_address + offset, position)
+            self.assertEqual(bytes(image[offset:offset + len(payload)]), payload)
+            end = offset + len(payload)
+            offset = (end + 3) & ~3
+            self.assertEqual(bytes(image[end:offset]), b"\xFF" * (offset - end))
+
+        # 0xFF fill up to the fixed size
+        self.assertEqual(image[offset:], b"\xFF" * (AudioConstants.ENGINE_HEX_FILE_SIZE - offset))
+
+    def test_event_image_layout(self):
+        merger = HexMerger("Event Sound", "00001003")
+        image = merger.merge_hex_data_list([b"\x01" * 3, b"\x02" * 4])
+
+        # 0xFF header (0x1003-0x100A), first payload (0x100B-0x100D),
+        # 0xFF padding up to the 4-byte aligned 0x1010, second payload (0x1010-0x1013)
+        self.assertEqual(bytes(image), b"\xFF" * 8 + b"\x01" * 3 + b"\xFF" * 2 + b"\x02" * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
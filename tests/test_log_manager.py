@@ -0,0 +1,70 @@
+"""
+=========================================================================================
+📌 File:         test_log_manager.py
+📌 Description:  Tests for LogManager CSV log output
+=========================================================================================
+"""
+
+import os
+import sys
+import csv
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import app_settings
+from file_manager import LogManager
+
+
+class LogManagerCsvTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        for name, value in (("use_default_path", False), ("custom_output_path", self._tmp.name)):
+            patcher = mock.patch.object(app_settings, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _save_and_read(self, log_manager):
+        log_filename, is_manual = log_manager.save_log_to_csv(manual_save=False)
+        self.assertFalse(is_manual)
+        log_path = os.path.join(log_manager.file_manager.get_output_folder_path(), log_filename)
+        with open(log_path, encoding='utf-8-sig', newline='') as f:
+            return list(csv.reader(f))
+
+    def test_log_rows_are_saved_as_columns(self):
+        log_manager = LogManager("Event Sound")
+        log_manager.add_log_entry("Processing started")
+        log_manager.add_log_row("File Name", "Start Address", "Data Length")
+        # Cells are written as given: no '|' splitting, commas are quoted
+        log_manager.add_log_row("a | b, c.wav", "0x00001008", "0x00000D31")
+
+        rows = self._save_and_read(log_manager)
+
+        self.assertEqual(rows, [
+            ["Message", "Start Address", "Data Length"],
+            ["Processing started", "", ""],
+            ["File Name", "Start Address", "Data Length"],
+            ["a | b, c.wav", "0x00001008", "0x00000D31"],
+        ])
+
+    def test_log_row_message_is_display_text(self):
+        log_manager = LogManager("Event Sound")
+        log_manager.add_log_row("x.wav", "0x00001008", "0x00000D31")
+
+        self.assertEqual(log_manager.log_entries[0]['message'], "x.wav | 0x00001008 | 0x00000D31")
+
+    def test_pipe_separated_entries_are_split(self):
+        log_manager = LogManager("Engine Sound")
+        log_manager.add_log_entry("x.wav                | 0x1011802C |  0x00000D81")
+
+        rows = self._save_and_read(log_manager)
+
+        self.assertEqual(rows[1], ["x.wav", "0x1011802C", "0x00000D81"])
+
+
+if __name__ == "__main__":
+    unittest.main()
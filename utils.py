@@ -11,13 +11,15 @@
     - FileConstants: File and folder name constants
     - UIConstants: UI size and layout constants
     - Exception classes: ProcessingError, AudioFileError, FlacConversionError, etc.
-    - get_exe_directory(): Utility function to get the executable directory
+    - get_exe_directory(): Utility function to get the executable directory (cached)
     
 📌 Key Constants:
     - MAGIC_KEY: Engine sound Magic Key (0x5AA55AA5)
     - ENGINE_HEADER_SIZE: Engine header size (44 bytes)
     - EVENT_HEADER_SIZE: Event header size (8 bytes)
+    - ENGINE_HEX_FILE_SIZE: Engine sound fixed image size (864KB)
     - DEFAULT_COMPRESSION: Default compression level ("8")
+    - MAX_COMPRESSION_LEVEL: Highest FLAC compression level (8)
     - DEFAULT_START_ADDRESS: Default start address ("10118000")
     
 📌 Dependencies:
@@ -44,8 +46,12 @@ class AudioConstants:
     # Filename buffer size
     FILENAME_BUFFER_SIZE = 80
     
-    # Memory alignment
+    # Memory alignment (power of two)
     WORD_ALIGNMENT = 4
+    WORD_ALIGNMENT_MASK = WORD_ALIGNMENT - 1
+    
+    # Engine sound fixed image size (864KB)
+    ENGINE_HEX_FILE_SIZE = 864 * 1024
     
     # HEX data offsets
     FLAC_SIZE_OFFSET = 0x0000
@@ -53,8 +59,16 @@ class AudioConstants:
     ENGINE_FLAC_DATA_OFFSET = 0x0054
     EVENT_FLAC_DATA_OFFSET = 0x0004
     
+    # Downsampling anti-aliasing filter (48kHz → 24kHz)
+    DECIMATION_FILTER_TAPS = 41       # Must be 4k+1 so the polyphase delay stays even
+    DECIMATION_KAISER_BETA = 8.6
+    
+    # Frames passed to the FLAC encoder per call (bounds the int32 conversion copy)
+    FLAC_ENCODE_CHUNK_FRAMES = 64 * 1024
+    
     # Default compression settings
     DEFAULT_COMPRESSION = "8"
+    MAX_COMPRESSION_LEVEL = 8         # Highest libFLAC preset (higher levels are clamped to 8)
     DEFAULT_BLOCK_SIZE = "512"
     
     # Default address
@@ -71,6 +85,18 @@ class FileConstants:
     ENGINE_BIN_FILE = "MergedEngineSound.bin"
     ENGINE_HEADER_FILE = "EngineSound_VARIANT.h"
     EVENT_HEX_FILE = "MergedEventSound.hex"
+    
+    # FLAC encoder library (shipped next to the executable)
+    FLAC_LIBRARY_FILE = "libFLAC.dll"
+    
+    # Write buffer sizes
+    LOG_WRITE_BUFFER_SIZE = 64 * 1024
+    HEX_WRITE_BUFFER_SIZE = 1024 * 1024
+    LOG_WRITE_BATCH_LINES = 1024    # CSV log lines formatted per write call
+
+    # Log compression
+    LOG_GZIP_THRESHOLD = 1024 * 1024    # Log text size above which the CSV is saved as .csv.gz
+    LOG_GZIP_LEVEL = 1
 
 class UIConstants:
     """UI related constants"""
@@ -84,6 +110,13 @@ class UIConstants:
     WAV_FILE_COLUMN_WIDTH = 600
     ADDRESS_COLUMN_WIDTH = 200
     TABLE_MARGIN = 25
+    
+    # Log view
+    LOG_MAX_BLOCK_COUNT = 100000
+    LOG_FLUSH_INTERVAL_MS = 50    # Log lines arriving within this interval are shown in one update
+    
+    # Status bar message display time (ms)
+    STATUS_MESSAGE_TIMEOUT_MS = 5000
 
 # Exception classes
 class ProcessingError(Exception):
@@ -106,11 +139,14 @@ class FilePermissionError(ProcessingError):
     """File permission error"""
     pass
 
+# Directory of the exe/script (fixed for the process lifetime, resolved once)
+if getattr(sys, 'frozen', False):
+    # If running with PyInstaller
+    _EXE_DIR = os.path.dirname(sys.executable)
+else:
+    # If running as a script
+    _EXE_DIR = os.path.dirname(os.path.abspath(__file__))
+
 def get_exe_directory():
     """Return the directory where the exe/script is located"""
-    if getattr(sys, 'frozen', False):
-        # If running with PyInstaller
-        return os.path.dirname(sys.executable)
-    else:
-        # If running as a script
-        return os.path.dirname(os.path.abspath(__file__)) 
\ No newline at end of file
+    return _EXE_DIR